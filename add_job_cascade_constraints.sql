@@ -0,0 +1,24 @@
+-- Ensure scraping job children are cleaned up by the database
+-- Run this in your Supabase SQL Editor on projects created before these
+-- constraints were part of supabase_schema.sql (safe to re-run)
+
+ALTER TABLE products
+    DROP CONSTRAINT IF EXISTS products_job_id_fkey,
+    ADD CONSTRAINT products_job_id_fkey
+        FOREIGN KEY (job_id) REFERENCES scraping_jobs(id) ON DELETE CASCADE;
+
+ALTER TABLE scraping_stats
+    DROP CONSTRAINT IF EXISTS scraping_stats_job_id_fkey,
+    ADD CONSTRAINT scraping_stats_job_id_fkey
+        FOREIGN KEY (job_id) REFERENCES scraping_jobs(id) ON DELETE CASCADE;
+
+-- Logs and notifications outlive the job; only detach them
+ALTER TABLE system_logs
+    DROP CONSTRAINT IF EXISTS system_logs_job_id_fkey,
+    ADD CONSTRAINT system_logs_job_id_fkey
+        FOREIGN KEY (job_id) REFERENCES scraping_jobs(id) ON DELETE SET NULL;
+
+ALTER TABLE notifications
+    DROP CONSTRAINT IF EXISTS notifications_job_id_fkey,
+    ADD CONSTRAINT notifications_job_id_fkey
+        FOREIGN KEY (job_id) REFERENCES scraping_jobs(id) ON DELETE SET NULL;
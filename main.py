@@ -1329,9 +1329,8 @@ async def deduplicate_products(current_user: dict = Depends(verify_token)):
         
         # Merge duplicates
         merged_count = 0
-        for duplicate_group in duplicate_groups:
-            merged_product = deduplicator.merge_duplicates(duplicate_group)
-            
+        merged_products = deduplicator.merge_duplicates_batch(duplicate_groups)
+        for duplicate_group, merged_product in zip(duplicate_groups, merged_products):
             # Keep the merged product and remove duplicates
             merged_product['id'] = duplicate_group[0]['id']  # Keep first product's ID
             products_db[merged_product['id']] = merged_product
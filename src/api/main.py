@@ -26,7 +26,11 @@ async def lifespan(app: FastAPI):
         logger.warning("Supabase not configured. Please set SUPABASE_URL and SUPABASE_ANON_KEY")
     else:
         logger.info("Supabase connection configured")
-    
+
+    # Build and cache the OpenAPI/JSON schemas up front so the first
+    # request to /docs doesn't pay for schema generation
+    app.openapi()
+
     yield
     
     # Shutdown
@@ -7,7 +7,7 @@ from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks
 from pydantic import BaseModel
 from loguru import logger
 
-from ...database.models import ScrapingJob, ScrapingStatus, User
+from ...database.models import Product, ScrapingJob, ScrapingStatus, User
 from ...database.service import db_service
 from ..auth import get_current_active_user
 from ...scraper.amazon import PremiumAmazonScraper
@@ -90,19 +90,24 @@ async def run_scraping_job(job_id: str):
         products_scraped = 0
         products_found = len(results)
         
+        products = []
         for result in results:
             if result.success and result.data:
                 try:
-                    from ...database.models import Product
-                    product = Product(
-                        job_id=job_id,
-                        retailer=job.retailer,
-                        **result.data
-                    )
-                    await db_service.create_product(product)
-                    products_scraped += 1
+                    products.append(Product(**{
+                        **result.data,
+                        "job_id": job_id,
+                        "retailer": job.retailer,
+                    }))
                 except Exception as e:
-                    logger.error(f"Error saving product: {e}")
+                    logger.error(f"Error validating product: {e}")
+        
+        if products:
+            try:
+                saved = await db_service.create_products_batch(products)
+                products_scraped = len(saved)
+            except Exception as e:
+                logger.error(f"Error saving products: {e}")
         
         # Update job completion
         await db_service.update_scraping_job(job_id, {
@@ -1,40 +1,27 @@
 """Database module."""
 
 from .models import (
-    Base,
+    ScrapingStatus,
+    UserRole,
+    User,
+    ScrapingJobBase,
+    ScrapingJob,
     Product,
-    Price,
-    ProductVariation,
-    ProductSpecification,
-    ProductImage,
-    ScrapingLog,
-    DuplicateProduct,
-    DataQualityLog,
-)
-from .connection import (
-    DatabaseManager,
-    get_db_session,
-    init_database,
-    close_database,
-    check_database_health,
-    db_manager,
+    ScrapingStats,
+    SystemLog,
+    Notification,
+    DashboardStats,
 )
 
 __all__ = [
-    "Base",
+    "ScrapingStatus",
+    "UserRole",
+    "User",
+    "ScrapingJobBase",
+    "ScrapingJob",
     "Product",
-    "Price",
-    "ProductVariation",
-    "ProductSpecification",
-    "ProductImage",
-    "ScrapingLog",
-    "DuplicateProduct",
-    "DataQualityLog",
-    "DatabaseManager",
-    "get_db_session",
-    "init_database",
-    "close_database",
-    "check_database_health",
-    "db_manager",
+    "ScrapingStats",
+    "SystemLog",
+    "Notification",
+    "DashboardStats",
 ]
-
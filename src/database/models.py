@@ -36,23 +36,27 @@ class User(BaseModel):
     last_login: Optional[datetime] = None
 
 
-class ScrapingJob(BaseModel):
-    """Scraping job model."""
-    id: Optional[str] = None
-    user_id: str = Field(..., description="User who created the job")
+class ScrapingJobBase(BaseModel):
+    """Fields shared by every scraping job representation."""
     name: str = Field(..., description="Job name")
     description: Optional[str] = Field(None, description="Job description")
     retailer: str = Field(..., description="Target retailer (amazon, walmart, etc.)")
-    category: Optional[str] = Field(None, description="Product category")
-    search_query: Optional[str] = Field(None, description="Search query")
-    max_pages: int = Field(5, description="Maximum pages to scrape")
     status: ScrapingStatus = Field(ScrapingStatus.PENDING, description="Job status")
-    progress: int = Field(0, description="Progress percentage (0-100)")
-    products_scraped: int = Field(0, description="Number of products scraped")
     products_found: int = Field(0, description="Number of products found")
     error_message: Optional[str] = Field(None, description="Error message if failed")
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+
+
+class ScrapingJob(ScrapingJobBase):
+    """Scraping job model."""
+    id: Optional[str] = None
+    user_id: str = Field(..., description="User who created the job")
+    category: Optional[str] = Field(None, description="Product category")
+    search_query: Optional[str] = Field(None, description="Search query")
+    max_pages: int = Field(5, description="Maximum pages to scrape")
+    progress: int = Field(0, description="Progress percentage (0-100)")
+    products_scraped: int = Field(0, description="Number of products scraped")
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
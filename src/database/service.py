@@ -2,9 +2,12 @@
 Database service layer for Supabase operations.
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from collections import Counter
+from operator import itemgetter
+from typing import AsyncIterator, List, Optional, Dict, Any
+from datetime import datetime, timezone
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError
 
 from .models import (
     User, ScrapingJob, Product, ScrapingStats, SystemLog, 
@@ -13,6 +16,14 @@ from .models import (
 from ..config.supabase import get_supabase_client, get_supabase_admin
 
 
+_product_list_adapter = TypeAdapter(List[Product])
+
+
+def _utc_iso() -> str:
+    """Current UTC time as an ISO 8601 string with millisecond precision."""
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds')
+
+
 class DatabaseService:
     """Database service for Supabase operations."""
     
@@ -24,7 +35,7 @@ class DatabaseService:
     async def create_user(self, user: User) -> User:
         """Create a new user."""
         try:
-            user_data = user.dict(exclude={'id', 'created_at', 'updated_at'})
+            user_data = user.model_dump(exclude={'id', 'created_at', 'updated_at'})
             result = self.admin_client.table('users').insert(user_data).execute()
             if result.data:
                 return User(**result.data[0])
@@ -58,7 +69,7 @@ class DatabaseService:
     async def update_user(self, user_id: str, updates: Dict[str, Any]) -> Optional[User]:
         """Update user."""
         try:
-            updates['updated_at'] = datetime.now().isoformat()
+            updates['updated_at'] = _utc_iso()
             result = self.client.table('users').update(updates).eq('id', user_id).execute()
             if result.data:
                 return User(**result.data[0])
@@ -71,7 +82,7 @@ class DatabaseService:
     async def create_scraping_job(self, job: ScrapingJob) -> ScrapingJob:
         """Create a new scraping job."""
         try:
-            job_data = job.dict(exclude={'id', 'created_at', 'updated_at'})
+            job_data = job.model_dump(exclude={'id', 'created_at', 'updated_at'})
             result = self.client.table('scraping_jobs').insert(job_data).execute()
             if result.data:
                 return ScrapingJob(**result.data[0])
@@ -103,7 +114,7 @@ class DatabaseService:
     async def update_scraping_job(self, job_id: str, updates: Dict[str, Any]) -> Optional[ScrapingJob]:
         """Update scraping job."""
         try:
-            updates['updated_at'] = datetime.now().isoformat()
+            updates['updated_at'] = _utc_iso()
             result = self.client.table('scraping_jobs').update(updates).eq('id', job_id).execute()
             if result.data:
                 return ScrapingJob(**result.data[0])
@@ -113,9 +124,13 @@ class DatabaseService:
             return None
     
     async def delete_scraping_job(self, job_id: str) -> bool:
-        """Delete scraping job."""
+        """Delete scraping job.
+
+        Products and stats are removed by the ON DELETE CASCADE foreign keys
+        (logs and notifications are detached), so this is a single statement.
+        """
         try:
-            result = self.client.table('scraping_jobs').delete().eq('id', job_id).execute()
+            self.client.table('scraping_jobs').delete().eq('id', job_id).execute()
             return True
         except Exception as e:
             logger.error(f"Error deleting scraping job {job_id}: {e}")
@@ -125,7 +140,7 @@ class DatabaseService:
     async def create_product(self, product: Product) -> Product:
         """Create a new product."""
         try:
-            product_data = product.dict(exclude={'id', 'created_at', 'updated_at'})
+            product_data = product.model_dump(exclude={'id', 'created_at', 'updated_at'})
             result = self.client.table('products').insert(product_data).execute()
             if result.data:
                 return Product(**result.data[0])
@@ -134,24 +149,76 @@ class DatabaseService:
             logger.error(f"Error creating product: {e}")
             raise
     
-    async def create_products_batch(self, products: List[Product]) -> List[Product]:
-        """Create multiple products in batch."""
-        try:
-            products_data = [product.dict(exclude={'id', 'created_at', 'updated_at'}) for product in products]
-            result = self.client.table('products').insert(products_data).execute()
-            return [Product(**product) for product in result.data]
-        except Exception as e:
-            logger.error(f"Error creating products batch: {e}")
-            raise
+    async def create_products_batch(self, products: List[Product], chunk_size: int = 500) -> List[Product]:
+        """Create multiple products in batch.
+        
+        Rows are inserted chunk_size at a time. If the database rejects a
+        chunk, its rows are retried one by one so only the bad rows are lost;
+        those are logged and left out of the result.
+        """
+        saved: List[Product] = []
+        products_data = [product.model_dump(mode='json', exclude={'id', 'created_at', 'updated_at'}) for product in products]
+        for start in range(0, len(products_data), chunk_size):
+            chunk = products_data[start:start + chunk_size]
+            try:
+                result = self.client.table('products').insert(chunk).execute()
+                saved.extend(_product_list_adapter.validate_python(result.data))
+                continue
+            except Exception as e:
+                logger.warning(f"Error creating products batch, retrying {len(chunk)} rows individually: {e}")
+            
+            for product_data in chunk:
+                try:
+                    result = self.client.table('products').insert(product_data).execute()
+                    saved.extend(_product_list_adapter.validate_python(result.data))
+                except Exception as e:
+                    logger.error(f"Error creating product {product_data.get('title', '')[:50]!r}: {e}")
+        return saved
+    
+    async def iter_job_products(self, job_id: str, page_size: int = 500) -> AsyncIterator[Product]:
+        """Stream products for a specific job, fetching one page at a time.
+        
+        A row that doesn't validate is logged and skipped; a failed fetch is
+        logged and ends the stream.
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+        
+        offset = 0
+        while True:
+            try:
+                result = self.client.table('products').select('*').eq('job_id', job_id).order('scraped_at', desc=True).range(offset, offset + page_size - 1).execute()
+            except Exception as e:
+                logger.error(f"Error streaming products for job {job_id}: {e}")
+                return
+            
+            for row in result.data:
+                try:
+                    product = Product(**row)
+                except ValidationError as e:
+                    logger.warning(f"Skipping invalid product {row.get('id')} for job {job_id}: {e}")
+                    continue
+                yield product
+            
+            if len(result.data) < page_size:
+                return
+            offset += page_size
     
     async def get_job_products(self, job_id: str, limit: int = 100) -> List[Product]:
         """Get products for a specific job."""
-        try:
-            result = self.client.table('products').select('*').eq('job_id', job_id).order('scraped_at', desc=True).limit(limit).execute()
-            return [Product(**product) for product in result.data]
-        except Exception as e:
-            logger.error(f"Error getting products for job {job_id}: {e}")
+        if limit <= 0:
             return []
+        
+        products = []
+        stream = self.iter_job_products(job_id, page_size=min(limit, 500))
+        try:
+            async for product in stream:
+                products.append(product)
+                if len(products) >= limit:
+                    break
+        finally:
+            await stream.aclose()
+        return products
     
     async def search_products(self, query: str, limit: int = 50) -> List[Product]:
         """Search products by title or description."""
@@ -166,7 +233,7 @@ class DatabaseService:
     async def create_scraping_stats(self, stats: ScrapingStats) -> ScrapingStats:
         """Create scraping statistics."""
         try:
-            stats_data = stats.dict(exclude={'id', 'created_at', 'updated_at'})
+            stats_data = stats.model_dump(exclude={'id', 'created_at', 'updated_at'})
             result = self.client.table('scraping_stats').insert(stats_data).execute()
             if result.data:
                 return ScrapingStats(**result.data[0])
@@ -190,7 +257,7 @@ class DatabaseService:
     async def create_log(self, log: SystemLog) -> SystemLog:
         """Create a system log entry."""
         try:
-            log_data = log.dict(exclude={'id', 'created_at'})
+            log_data = log.model_dump(exclude={'id', 'created_at'})
             result = self.client.table('system_logs').insert(log_data).execute()
             if result.data:
                 return SystemLog(**result.data[0])
@@ -212,7 +279,7 @@ class DatabaseService:
     async def create_notification(self, notification: Notification) -> Notification:
         """Create a notification."""
         try:
-            notification_data = notification.dict(exclude={'id', 'created_at', 'read_at'})
+            notification_data = notification.model_dump(exclude={'id', 'created_at', 'read_at'})
             result = self.client.table('notifications').insert(notification_data).execute()
             if result.data:
                 return Notification(**result.data[0])
@@ -236,7 +303,7 @@ class DatabaseService:
     async def mark_notification_read(self, notification_id: str) -> bool:
         """Mark notification as read."""
         try:
-            result = self.client.table('notifications').update({'is_read': True, 'read_at': datetime.now().isoformat()}).eq('id', notification_id).execute()
+            result = self.client.table('notifications').update({'is_read': True, 'read_at': _utc_iso()}).eq('id', notification_id).execute()
             return True
         except Exception as e:
             logger.error(f"Error marking notification {notification_id} as read: {e}")
@@ -248,16 +315,13 @@ class DatabaseService:
         try:
             # Get job counts
             jobs_result = self.client.table('scraping_jobs').select('status').execute()
-            job_counts = {'total': 0, 'active': 0, 'completed': 0, 'failed': 0}
-            for job in jobs_result.data:
-                job_counts['total'] += 1
-                status = job['status']
-                if status in ['pending', 'running']:
-                    job_counts['active'] += 1
-                elif status == 'completed':
-                    job_counts['completed'] += 1
-                elif status == 'failed':
-                    job_counts['failed'] += 1
+            status_counts = Counter(map(itemgetter('status'), jobs_result.data))
+            job_counts = {
+                'total': len(jobs_result.data),
+                'active': status_counts['pending'] + status_counts['running'],
+                'completed': status_counts['completed'],
+                'failed': status_counts['failed'],
+            }
             
             # Get product count
             products_result = self.client.table('products').select('id', count='exact').execute()
@@ -1,8 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic.dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
 
+from ..database.models import ScrapingJobBase, ScrapingStatus
+
 class AvailabilityStatus(str, Enum):
     IN_STOCK = "in_stock"
     OUT_OF_STOCK = "out_of_stock"
@@ -10,14 +13,8 @@ class AvailabilityStatus(str, Enum):
     LIMITED_STOCK = "limited_stock"
     UNKNOWN = "unknown"
 
-class ScrapingStatus(str, Enum):
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
-
-class ProductVariation(BaseModel):
+@dataclass(slots=True, config=ConfigDict(extra='forbid'))
+class ProductVariation:
     """Product variation (size, color, style, etc.)"""
     variation_type: str  # "size", "color", "style", etc.
     variation_value: str  # "Large", "Red", "Classic", etc.
@@ -26,7 +23,8 @@ class ProductVariation(BaseModel):
     sku: Optional[str] = None
     image_url: Optional[str] = None
 
-class ProductDimensions(BaseModel):
+@dataclass(slots=True, config=ConfigDict(extra='forbid'))
+class ProductDimensions:
     """Product dimensions"""
     length: Optional[float] = None
     width: Optional[float] = None
@@ -34,7 +32,8 @@ class ProductDimensions(BaseModel):
     weight: Optional[float] = None
     unit: str = "inches"  # "inches", "cm", "lbs", "kg"
 
-class ReviewDistribution(BaseModel):
+@dataclass(slots=True, config=ConfigDict(extra='forbid'))
+class ReviewDistribution:
     """Review rating distribution"""
     five_star: int = 0
     four_star: int = 0
@@ -58,7 +57,7 @@ class ProductData(BaseModel):
     # Pricing & Availability
     current_price: Optional[float] = Field(None, ge=0)
     original_price: Optional[float] = Field(None, ge=0)
-    discount_percentage: Optional[float] = Field(None, ge=0, le=100)
+    discount_percentage: Optional[float] = None  # bounded by _fill_discount
     availability: AvailabilityStatus = AvailabilityStatus.UNKNOWN
     stock_quantity: Optional[int] = Field(None, ge=0)
     shipping_info: Optional[str] = None
@@ -100,11 +99,17 @@ class ProductData(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(use_enum_values=True)
+    
+    @model_validator(mode='after')
+    def _fill_discount(self) -> 'ProductData':
+        """Derive the discount from the prices when missing and clamp it to 0-100"""
+        discount = self.discount_percentage
+        if discount is None and self.current_price and self.original_price:
+            discount = (1 - self.current_price / self.original_price) * 100
+        if discount is not None:
+            self.discount_percentage = max(0.0, min(100.0, discount))
+        return self
 
 class ScrapingJobCreate(BaseModel):
     """Enhanced job creation model"""
@@ -131,29 +136,22 @@ class ScrapingJobCreate(BaseModel):
     schedule_type: str = Field(default="manual")  # "manual", "hourly", "daily", "weekly"
     priority: int = Field(default=1, ge=1, le=10)
 
-class ScrapingJob(BaseModel):
+class ScrapingJob(ScrapingJobBase):
     """Enhanced job model"""
     id: str
-    name: str
-    description: Optional[str] = None
-    retailer: str
     job_type: str
     status: ScrapingStatus
     configuration: Dict[str, Any] = Field(default_factory=dict)
     
     # Results
-    products_found: int = 0
     products_processed: int = 0
     products_successful: int = 0
     products_failed: int = 0
     
     # Timing
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
     estimated_completion: Optional[datetime] = None
     
     # Error handling
-    error_message: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 3
     
@@ -161,11 +159,7 @@ class ScrapingJob(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(use_enum_values=True)
 
 class PriceUpdate(BaseModel):
     """Price update model for real-time sync"""
@@ -177,11 +171,7 @@ class PriceUpdate(BaseModel):
     change_percentage: Optional[float] = None
     detected_at: datetime = Field(default_factory=datetime.now)
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(use_enum_values=True)
 
 class CurationRule(BaseModel):
     """Product curation rule"""
@@ -215,8 +205,3 @@ class MarketplaceStats(BaseModel):
     uptime_percentage: float = 0.0
     
     last_updated: datetime = Field(default_factory=datetime.now)
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
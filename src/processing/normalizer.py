@@ -1,10 +1,64 @@
 import re
 import hashlib
-from typing import List, Dict, Any, Optional
-from difflib import SequenceMatcher
+import zlib
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Any, Optional, Set, Tuple, Union
 from datetime import datetime
 import json
 
+import numpy as np
+from rapidfuzz import fuzz, process
+
+_WS_RE = re.compile(r'\s+')
+_NONPRICE_RE = re.compile(r'[^\d.]')
+_NUMERIC_RE = re.compile(r'(\d+\.?\d*)')
+# Retailer prefixes, stripped in this order (each at most once)
+_TITLE_PREFIX_RE = re.compile(
+    r'^(?:Amazon\.com: )?(?:Walmart\.com: )?(?:Target\.com: )?(?:Best Buy: )?'
+    r'(?:\[.*?\] )?(?:\(.*?\) )?',
+    re.IGNORECASE
+)
+# Company suffixes, peeled off the end from " Brand" inwards to " Ltd"
+_BRAND_SUFFIX_RE = re.compile(
+    r'(?: Ltd\.?)?(?: Corp\.?)?(?: LLC\.?)?(?: Inc\.?)?(?:\.com)?(?: Brand)?$',
+    re.IGNORECASE
+)
+
+# Map various availability strings to standard values; keys are lowercased
+# with runs of spaces, hyphens and underscores collapsed to a single space
+_AVAIL_SEPARATOR_RE = re.compile(r'[\s\-_]+')
+_AVAIL_MAP = {
+    'in stock': 'in_stock',
+    'available': 'in_stock',
+    'stock': 'in_stock',
+    'out of stock': 'out_of_stock',
+    'unavailable': 'out_of_stock',
+    'not available': 'out_of_stock',
+    'pre order': 'pre_order',
+    'preorder': 'pre_order',
+    'coming soon': 'pre_order',
+    'limited stock': 'limited_stock',
+    'low stock': 'limited_stock',
+    'few left': 'limited_stock',
+}
+# Small integer codes for the standard availability values, so curation can
+# compare an int8 column instead of strings
+_AVAIL_CODE = {'unknown': 0, 'in_stock': 1, 'out_of_stock': 2, 'pre_order': 3, 'limited_stock': 4}
+
+# MinHash/LSH blocking for duplicate detection. 32 bands of 3 rows put the
+# candidate threshold around a 0.3 shingle Jaccard, well below the title
+# similarity a real duplicate needs, so blocking trades very little recall.
+_LSH_BANDS = 32
+_LSH_ROWS = 3
+_MINHASH_PRIME = (1 << 31) - 1
+_minhash_rng = np.random.default_rng(0x5EED)
+_MINHASH_A = _minhash_rng.integers(1, _MINHASH_PRIME, size=_LSH_BANDS * _LSH_ROWS, dtype=np.int64)
+_MINHASH_B = _minhash_rng.integers(0, _MINHASH_PRIME, size=_LSH_BANDS * _LSH_ROWS, dtype=np.int64)
+# Title pairs whose 64-bit word SimHashes differ in more bits than this are
+# rejected before any fuzzy matching
+_SIMHASH_MAX_DISTANCE = 16
+
 class DataNormalizer:
     """Handles data normalization across different retailers"""
     
@@ -15,33 +69,24 @@ class DataNormalizer:
             return None
         
         # Remove currency symbols and commas
-        cleaned = re.sub(r'[^\d.]', '', str(price_str))
+        cleaned = _NONPRICE_RE.sub('', str(price_str))
         try:
             return float(cleaned)
         except ValueError:
             return None
     
     @staticmethod
+    @lru_cache(maxsize=65536)
     def normalize_title(title: str) -> str:
         """Normalize product titles"""
         if not title:
             return ""
         
         # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', title.strip())
-        
-        # Remove common retailer-specific prefixes/suffixes
-        prefixes_to_remove = [
-            r'^Amazon\.com: ',
-            r'^Walmart\.com: ',
-            r'^Target\.com: ',
-            r'^Best Buy: ',
-            r'^\[.*?\] ',
-            r'^\(.*?\) '
-        ]
+        normalized = _WS_RE.sub(' ', title.strip())
         
-        for prefix in prefixes_to_remove:
-            normalized = re.sub(prefix, '', normalized, flags=re.IGNORECASE)
+        # Remove common retailer-specific prefixes
+        normalized = _TITLE_PREFIX_RE.sub('', normalized, count=1)
         
         return normalized.strip()
     
@@ -52,48 +97,19 @@ class DataNormalizer:
             return ""
         
         # Remove common brand suffixes
-        suffixes_to_remove = [
-            r' Brand$',
-            r'\.com$',
-            r' Inc\.?$',
-            r' LLC\.?$',
-            r' Corp\.?$',
-            r' Ltd\.?$'
-        ]
-        
-        normalized = brand.strip()
-        for suffix in suffixes_to_remove:
-            normalized = re.sub(suffix, '', normalized, flags=re.IGNORECASE)
+        normalized = _BRAND_SUFFIX_RE.sub('', brand.strip(), count=1)
         
         return normalized.strip()
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def normalize_availability(availability: str) -> str:
         """Normalize availability status"""
         if not availability:
             return "unknown"
         
-        availability_lower = availability.lower().strip()
-        
-        # Map various availability strings to standard values
-        availability_map = {
-            'in stock': 'in_stock',
-            'available': 'in_stock',
-            'in-stock': 'in_stock',
-            'stock': 'in_stock',
-            'out of stock': 'out_of_stock',
-            'out-of-stock': 'out_of_stock',
-            'unavailable': 'out_of_stock',
-            'not available': 'out_of_stock',
-            'pre-order': 'pre_order',
-            'preorder': 'pre_order',
-            'coming soon': 'pre_order',
-            'limited stock': 'limited_stock',
-            'low stock': 'limited_stock',
-            'few left': 'limited_stock'
-        }
-        
-        return availability_map.get(availability_lower, 'unknown')
+        key = _AVAIL_SEPARATOR_RE.sub(' ', availability.lower().strip())
+        return _AVAIL_MAP.get(key, 'unknown')
     
     @staticmethod
     def normalize_dimensions(dimensions: Dict[str, Any]) -> Dict[str, float]:
@@ -109,7 +125,7 @@ class DataNormalizer:
                 value = dimensions[key]
                 if isinstance(value, str):
                     # Extract numeric value from string
-                    numeric_match = re.search(r'(\d+\.?\d*)', value)
+                    numeric_match = _NUMERIC_RE.search(value)
                     if numeric_match:
                         normalized[key] = float(numeric_match.group(1))
                 elif isinstance(value, (int, float)):
@@ -123,19 +139,12 @@ class DataNormalizer:
         if not specs:
             return {}
         
-        normalized = {}
-        
-        for key, value in specs.items():
-            # Normalize key names
-            normalized_key = key.lower().strip()
-            normalized_key = re.sub(r'\s+', ' ', normalized_key)
-            
-            # Normalize values
-            normalized_value = value.strip()
-            if normalized_value:
-                normalized[normalized_key] = normalized_value
-        
-        return normalized
+        # Collapse whitespace in key names, drop entries whose value is blank
+        return {
+            _WS_RE.sub(' ', key.lower().strip()): normalized_value
+            for key, value in specs.items()
+            if (normalized_value := value.strip())
+        }
 
 class ProductDeduplicator:
     """Handles product deduplication and matching"""
@@ -149,48 +158,58 @@ class ProductDeduplicator:
     
     def calculate_similarity(self, product1: Dict[str, Any], product2: Dict[str, Any]) -> float:
         """Calculate similarity score between two products"""
-        scores = []
+        distance = bin(
+            _simhash(_normalized_text(product1.get('title', '')))
+            ^ _simhash(_normalized_text(product2.get('title', '')))
+        ).count('1')
+        if distance > _SIMHASH_MAX_DISTANCE:
+            return 0.0
         
-        # Title similarity
-        title_sim = self._text_similarity(
+        # Score the cheap and most discriminative parts first and give up as
+        # soon as the remaining parts, even at 1.0, can't reach the threshold
+        price_score = self._price_similarity(
+            product1.get('current_price'),
+            product2.get('current_price')
+        ) * self.price_weight
+        
+        title_score = self._text_similarity(
             product1.get('title', ''),
-            product2.get('title', '')
-        )
-        scores.append(title_sim * self.title_weight)
+            product2.get('title', ''),
+            score_cutoff=self._title_cutoff()
+        ) * self.title_weight
+        if title_score + price_score + self.brand_weight + self.spec_weight < self.similarity_threshold:
+            return 0.0
         
-        # Brand similarity
-        brand_sim = self._text_similarity(
+        brand_score = self._text_similarity(
             product1.get('brand', ''),
             product2.get('brand', '')
-        )
-        scores.append(brand_sim * self.brand_weight)
-        
-        # Price similarity
-        price_sim = self._price_similarity(
-            product1.get('current_price'),
-            product2.get('current_price')
-        )
-        scores.append(price_sim * self.price_weight)
+        ) * self.brand_weight
+        if title_score + brand_score + price_score + self.spec_weight < self.similarity_threshold:
+            return 0.0
         
-        # Specifications similarity
-        spec_sim = self._specifications_similarity(
+        spec_score = self._specifications_similarity(
             product1.get('specifications', {}),
             product2.get('specifications', {})
-        )
-        scores.append(spec_sim * self.spec_weight)
-        
-        return sum(scores)
+        ) * self.spec_weight
+        return title_score + brand_score + spec_score + price_score
+    
+    def _title_cutoff(self) -> float:
+        """Lowest title similarity (0-100) that can still reach the threshold
+        with every other component at 1.0"""
+        max_remaining = self.brand_weight + self.price_weight + self.spec_weight
+        return max(0, int((self.similarity_threshold - max_remaining) / self.title_weight * 100))
     
-    def _text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate text similarity using SequenceMatcher"""
+    def _text_similarity(self, text1: str, text2: str, score_cutoff: float = 0) -> float:
+        """Calculate word-order-insensitive text similarity (0-1); anything
+        below score_cutoff (0-100) comes back as 0"""
         if not text1 or not text2:
             return 0.0
         
         # Normalize texts
-        norm1 = DataNormalizer.normalize_title(text1).lower()
-        norm2 = DataNormalizer.normalize_title(text2).lower()
+        norm1 = _normalized_text(text1)
+        norm2 = _normalized_text(text2)
         
-        return SequenceMatcher(None, norm1, norm2).ratio()
+        return fuzz.token_sort_ratio(norm1, norm2, score_cutoff=score_cutoff) / 100.0
     
     def _price_similarity(self, price1: Optional[float], price2: Optional[float]) -> float:
         """Calculate price similarity"""
@@ -209,46 +228,127 @@ class ProductDeduplicator:
             return 0.0
         
         # Find common specification keys
-        common_keys = set(specs1.keys()) & set(specs2.keys())
+        common_keys = specs1.keys() & specs2.keys()
         if not common_keys:
             return 0.0
         
         # Calculate average similarity for common specs
-        similarities = []
-        for key in common_keys:
-            sim = self._text_similarity(specs1[key], specs2[key])
-            similarities.append(sim)
-        
-        return sum(similarities) / len(similarities) if similarities else 0.0
+        similarities = [self._text_similarity(specs1[key], specs2[key]) for key in common_keys]
+        return sum(similarities) / len(similarities)
     
     def find_duplicates(self, products: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
         """Find duplicate products in a list"""
-        duplicates = []
-        processed = set()
-        
-        for i, product1 in enumerate(products):
-            if i in processed:
+        # Normalize each title and brand once instead of once per pair
+        titles = [_normalized_text(product.get('title', '')) for product in products]
+        brands = [_normalized_text(product.get('brand', '')) for product in products]
+        
+        # 1. Exact fingerprint matches, 2. LSH candidate generation among
+        # what's left, 3. pair scoring, 4. connected components. Scoring only
+        # reads the candidate arrays, so it can be farmed out independently
+        # of the (cheap, serial) union-find
+        groups = _DisjointSet(len(products))
+        representatives = self._fingerprint_groups(products, titles, brands, groups)
+        
+        left, right = self._candidate_pairs([titles[i] for i in representatives.tolist()])
+        left, right = representatives[left], representatives[right]
+        scores = self._score_pairs(products, titles, brands, left, right)
+        
+        matched = scores >= self.similarity_threshold
+        for i, j in zip(left[matched].tolist(), right[matched].tolist()):
+            groups.union(i, j)
+        
+        return [
+            [products[i] for i in members]
+            for members in groups.components()
+            if len(members) > 1
+        ]
+    
+    def _fingerprint_groups(self, products: List[Dict[str, Any]], titles: List[str], brands: List[str],
+                            groups: '_DisjointSet') -> np.ndarray:
+        """Union products with the same brand, title and price (to the cent),
+        and return the indices that still need fuzzy matching (one per group)
+        
+        Such a pair scores at least title + brand + price weight (a sub-cent
+        price difference costs next to nothing), so this is only done while
+        those weights alone clear the threshold.
+        """
+        exact_weight = self.title_weight + self.brand_weight + self.price_weight
+        if exact_weight - 0.01 < self.similarity_threshold:
+            return np.arange(len(products), dtype=np.intp)
+        
+        buckets: Dict[int, Tuple[bytes, int]] = {}
+        representatives = []
+        
+        for index, product in enumerate(products):
+            price = product.get('current_price')
+            if not (titles[index] and brands[index] and price):
+                # Without all three an exact match isn't enough to be a duplicate
+                representatives.append(index)
                 continue
             
-            duplicate_group = [product1]
-            
-            for j, product2 in enumerate(products[i+1:], i+1):
-                if j in processed:
-                    continue
-                
-                similarity = self.calculate_similarity(product1, product2)
-                if similarity >= self.similarity_threshold:
-                    duplicate_group.append(product2)
-                    processed.add(j)
-            
-            if len(duplicate_group) > 1:
-                duplicates.append(duplicate_group)
-                processed.add(i)
+            key = f"{brands[index]}|{titles[index]}|{round(price, 2)}".encode()
+            fingerprint = zlib.crc32(key)
+            first = buckets.setdefault(fingerprint, (key, index))
+            if first[1] == index or first[0] != key:
+                # First of its kind, or a CRC collision with a different key
+                representatives.append(index)
+            else:
+                groups.union(first[1], index)
+        
+        return np.array(representatives, dtype=np.intp)
+    
+    def _candidate_pairs(self, titles: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Left/right index arrays of the pairs worth scoring"""
+        pairs = _lsh_candidate_pairs(titles)
+        if not pairs:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty
+        
+        # Drop candidates whose title SimHashes are too far apart to be worth
+        # fuzzy matching
+        left, right = np.array(pairs, dtype=np.intp).T
+        simhashes = np.fromiter((_simhash(title) for title in titles), dtype=np.uint64, count=len(titles))
+        close = _hamming_distances(simhashes[left] ^ simhashes[right]) <= _SIMHASH_MAX_DISTANCE
+        return left[close], right[close]
+    
+    def _score_pairs(self, products: List[Dict[str, Any]], titles: List[str], brands: List[str],
+                     left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """calculate_similarity for every candidate pair, as one float array.
+        Pairs that can't reach the threshold keep a partial score below it"""
+        # Score price for every candidate edge at once, then add the text parts
+        prices = np.fromiter(
+            (product.get('current_price') or np.nan for product in products),
+            dtype=np.float64,
+            count=len(products)
+        )
+        price_scores = _price_similarities(prices, left, right) * self.price_weight
+        title_scores = _pairwise_text_similarities(
+            titles, left, right, score_cutoff=self._title_cutoff()
+        ) * self.title_weight
+        scores = price_scores + title_scores
+        
+        # Same early exits as calculate_similarity, applied to the whole
+        # candidate set: only pairs that can still reach the threshold get
+        # their brand, then specifications scored
+        live = np.flatnonzero(
+            title_scores + price_scores + self.brand_weight + self.spec_weight >= self.similarity_threshold
+        )
+        brand_scores = _pairwise_text_similarities(brands, left[live], right[live]) * self.brand_weight
+        reachable = (
+            title_scores[live] + brand_scores + price_scores[live] + self.spec_weight >= self.similarity_threshold
+        )
+        live, brand_scores = live[reachable], brand_scores[reachable]
+        spec_scores = _specification_similarities(products, left[live], right[live]) * self.spec_weight
         
-        return duplicates
+        scores[live] = title_scores[live] + brand_scores + spec_scores + price_scores[live]
+        return scores
     
-    def merge_duplicates(self, duplicate_group: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Merge duplicate products into a single product"""
+    def merge_duplicates(self, duplicate_group: List[Dict[str, Any]], merged_at: Optional[str] = None,
+                         quality_scores: Optional[List[float]] = None) -> Dict[str, Any]:
+        """Merge duplicate products into a single product
+        
+        quality_scores, one per product, default to _quality_scores(duplicate_group)
+        """
         if not duplicate_group:
             return {}
         
@@ -256,43 +356,210 @@ class ProductDeduplicator:
             return duplicate_group[0]
         
         # Start with the product with highest data quality score
-        best_product = max(duplicate_group, key=lambda p: p.get('data_quality_score', 0))
+        if quality_scores is None:
+            quality_scores = _quality_scores(duplicate_group)
+        best_product = duplicate_group[max(range(len(duplicate_group)), key=quality_scores.__getitem__)]
         merged = best_product.copy()
         
-        # Merge additional data from other products
-        for product in duplicate_group:
-            if product == best_product:
-                continue
-            
-            # Merge additional images
-            if 'additional_images' in product:
-                merged_images = merged.get('additional_images', [])
-                for img in product['additional_images']:
-                    if img not in merged_images:
-                        merged_images.append(img)
-                merged['additional_images'] = merged_images
-            
-            # Merge features
-            if 'features' in product:
-                merged_features = merged.get('features', [])
-                for feature in product['features']:
-                    if feature not in merged_features:
-                        merged_features.append(feature)
-                merged['features'] = merged_features
-            
-            # Merge specifications (keep best product's specs as primary)
-            if 'specifications' in product:
-                merged_specs = merged.get('specifications', {})
-                for key, value in product['specifications'].items():
-                    if key not in merged_specs and value:
-                        merged_specs[key] = value
-                merged['specifications'] = merged_specs
+        others = [product for product in duplicate_group if product is not best_product]
+        
+        # Merge images and features in order, best product's first, into new
+        # lists so the input products are never mutated
+        for key in ('additional_images', 'features'):
+            if any(key in product for product in others):
+                merged[key] = list(dict.fromkeys(chain(best_product.get(key) or [], *(
+                    product.get(key) or [] for product in others
+                ))))
+        
+        # Merge specifications (keep best product's specs as primary)
+        if any('specifications' in product for product in others):
+            merged_specs = dict(best_product.get('specifications') or {})
+            for product in others:
+                for key, value in (product.get('specifications') or {}).items():
+                    if value:
+                        merged_specs.setdefault(key, value)
+            merged['specifications'] = merged_specs
         
         # Update metadata
         merged['duplicate_count'] = len(duplicate_group)
-        merged['merged_at'] = datetime.now().isoformat()
+        merged['merged_at'] = merged_at or datetime.now().isoformat()
         
         return merged
+    
+    def merge_duplicates_batch(self, duplicate_groups: List[List[Dict[str, Any]]],
+                               now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Merge every duplicate group, stamping them all with one merged_at"""
+        merged_at = (now or datetime.now()).isoformat()
+        
+        # Score every product that lacks a stored score in one batch
+        scores = _quality_scores(list(chain.from_iterable(duplicate_groups)))
+        merged = []
+        start = 0
+        for group in duplicate_groups:
+            merged.append(self.merge_duplicates(group, merged_at, scores[start:start + len(group)]))
+            start += len(group)
+        return merged
+
+def _normalized_text(text: str) -> str:
+    """Normalized, lowercased form used for all text comparisons"""
+    return DataNormalizer.normalize_title(text).lower()
+
+def _shingles(text: str, k: int = 4) -> Set[str]:
+    """Character k-grams of an already normalized text"""
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+def _minhash_signature(shingles: Set[str]) -> np.ndarray:
+    """MinHash signature of a shingle set under the module's hash family"""
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode()) for shingle in shingles),
+        dtype=np.int64,
+        count=len(shingles)
+    )
+    return ((np.outer(hashes, _MINHASH_A) + _MINHASH_B) % _MINHASH_PRIME).min(axis=0)
+
+def _lsh_candidate_pairs(titles: List[str]) -> List[Tuple[int, int]]:
+    """Index pairs whose normalized titles share at least one LSH band bucket"""
+    buckets: Dict[Tuple[int, bytes], List[int]] = {}
+    
+    for index, title in enumerate(titles):
+        shingles = _shingles(title)
+        if not shingles:
+            # Without a title no pair can reach the similarity threshold
+            continue
+        signature = _minhash_signature(shingles)
+        for band in range(_LSH_BANDS):
+            key = signature[band * _LSH_ROWS:(band + 1) * _LSH_ROWS].tobytes()
+            buckets.setdefault((band, key), []).append(index)
+    
+    pairs = set()
+    for members in buckets.values():
+        for a in range(len(members)):
+            for b in range(a + 1, len(members)):
+                pairs.add((members[a], members[b]))
+    
+    return sorted(pairs)
+
+@lru_cache(maxsize=16384)
+def _simhash(text: str) -> int:
+    """64-bit SimHash of an already normalized text over its word tokens"""
+    tokens = text.split()
+    if not tokens:
+        return 0
+    hashes = np.frombuffer(
+        b''.join(hashlib.blake2b(token.encode(), digest_size=8).digest() for token in tokens),
+        dtype=np.uint8
+    ).reshape(len(tokens), 8)
+    # Each token votes +1/-1 per bit; the fingerprint keeps the majority
+    votes = (2 * np.unpackbits(hashes, axis=1).astype(np.int32) - 1).sum(axis=0)
+    return int.from_bytes(np.packbits(votes > 0).tobytes(), 'big')
+
+def _hamming_distances(xor: np.ndarray) -> np.ndarray:
+    """Population count of each value in a uint64 array"""
+    return np.unpackbits(xor.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
+
+def _pairwise_text_similarities(texts: List[str], left: np.ndarray, right: np.ndarray,
+                                score_cutoff: float = 0) -> np.ndarray:
+    """_text_similarity over index pairs of already normalized texts. RapidFuzz
+    scores the pairs on all cores outside the GIL"""
+    texts1 = [texts[i] for i in left.tolist()]
+    texts2 = [texts[j] for j in right.tolist()]
+    similarities = process.cpdist(
+        texts1, texts2, scorer=fuzz.token_sort_ratio, dtype=np.float64, workers=-1,
+        score_cutoff=score_cutoff
+    ) / 100.0
+    empty = np.fromiter((not (a and b) for a, b in zip(texts1, texts2)), dtype=bool, count=len(texts1))
+    similarities[empty] = 0.0
+    return similarities
+
+def _specification_similarities(products: List[Dict[str, Any]], left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """_specifications_similarity over index pairs. The values of every
+    common key across all pairs are scored in a single cpdist call and then
+    averaged back per pair"""
+    values1, values2, owners = [], [], []
+    for k, (i, j) in enumerate(zip(left.tolist(), right.tolist())):
+        specs1 = products[i].get('specifications') or {}
+        specs2 = products[j].get('specifications') or {}
+        if not specs1 or not specs2:
+            continue
+        for key in specs1.keys() & specs2.keys():
+            values1.append(specs1[key])
+            values2.append(specs2[key])
+            owners.append(k)
+    
+    similarities = process.cpdist(
+        [_normalized_text(value) for value in values1],
+        [_normalized_text(value) for value in values2],
+        scorer=fuzz.token_sort_ratio, dtype=np.float64, workers=-1
+    ) / 100.0
+    empty = np.fromiter((not (a and b) for a, b in zip(values1, values2)), dtype=bool, count=len(values1))
+    similarities[empty] = 0.0
+    
+    totals = np.bincount(owners, weights=similarities, minlength=len(left))
+    counts = np.bincount(owners, minlength=len(left))
+    return np.divide(totals, counts, out=np.zeros(len(left)), where=counts > 0)
+
+def _price_similarities(prices: np.ndarray, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Vectorized _price_similarity over index pairs; NaN marks a missing price"""
+    a, b = prices[left], prices[right]
+    with np.errstate(invalid='ignore'):
+        similarity = 1.0 - np.abs(a - b) / np.maximum(a, b)
+    return np.where(np.isnan(similarity), 0.0, np.maximum(similarity, 0.0))
+
+class _DisjointSet:
+    """Union-find over integer indices with path halving"""
+    
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+    
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    def union(self, i: int, j: int):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            # Keep the lowest index as root so groups stay in input order
+            if root_j < root_i:
+                root_i, root_j = root_j, root_i
+            self.parent[root_j] = root_i
+    
+    def components(self) -> List[List[int]]:
+        members: Dict[int, List[int]] = {}
+        for i in range(len(self.parent)):
+            members.setdefault(self.find(i), []).append(i)
+        return list(members.values())
+
+# Data quality weights in hundredths, one per _quality_features entry. Integer
+# weights keep the score exact at the grade boundaries
+_QUALITY_WEIGHTS = np.array([
+    15, 10, 10, 5,  # Core information (40% of score)
+    15, 10,         # Pricing & Availability (25% of score)
+    10, 5,          # Media (15% of score)
+    8, 7,           # Specifications & Features (15% of score)
+    3, 2,           # Social Proof (5% of score)
+], dtype=np.int64)
+
+def _quality_features(product: Dict[str, Any]) -> Tuple[bool, ...]:
+    """Presence flags for each field the data quality score rewards"""
+    return (
+        bool(product.get('title')),
+        bool(product.get('brand')),
+        bool(product.get('description') or product.get('bullet_points')),
+        bool(product.get('category')),
+        bool(product.get('current_price')),
+        product.get('availability') != 'unknown',
+        bool(product.get('primary_image_url')),
+        bool(product.get('additional_images')),
+        bool(product.get('specifications')),
+        bool(product.get('features')),
+        bool(product.get('rating')),
+        bool(product.get('review_count')),
+    )
 
 class DataQualityScorer:
     """Calculates data quality scores for products"""
@@ -300,44 +567,18 @@ class DataQualityScorer:
     @staticmethod
     def calculate_quality_score(product: Dict[str, Any]) -> float:
         """Calculate comprehensive data quality score"""
-        score = 0.0
-        max_score = 1.0
-        
-        # Core information (40% of score)
-        if product.get('title'):
-            score += 0.15
-        if product.get('brand'):
-            score += 0.10
-        if product.get('description') or product.get('bullet_points'):
-            score += 0.10
-        if product.get('category'):
-            score += 0.05
-        
-        # Pricing & Availability (25% of score)
-        if product.get('current_price'):
-            score += 0.15
-        if product.get('availability') != 'unknown':
-            score += 0.10
-        
-        # Media (15% of score)
-        if product.get('primary_image_url'):
-            score += 0.10
-        if product.get('additional_images'):
-            score += 0.05
-        
-        # Specifications & Features (15% of score)
-        if product.get('specifications'):
-            score += 0.08
-        if product.get('features'):
-            score += 0.07
-        
-        # Social Proof (5% of score)
-        if product.get('rating'):
-            score += 0.03
-        if product.get('review_count'):
-            score += 0.02
-        
-        return min(score, max_score)
+        score = sum(
+            weight for weight, present in zip(_QUALITY_WEIGHTS.tolist(), _quality_features(product)) if present
+        )
+        return min(score / 100, 1.0)
+    
+    @staticmethod
+    def calculate_quality_scores(products: List[Dict[str, Any]]) -> np.ndarray:
+        """calculate_quality_score for a whole catalog, as one float array"""
+        if not products:
+            return np.zeros(0)
+        features = np.array([_quality_features(product) for product in products], dtype=np.int64)
+        return np.minimum(features @ _QUALITY_WEIGHTS / 100, 1.0)
     
     @staticmethod
     def get_quality_grade(score: float) -> str:
@@ -353,6 +594,17 @@ class DataQualityScorer:
         else:
             return "F"
 
+def _quality_scores(products: List[Dict[str, Any]]) -> List[float]:
+    """Each product's stored data_quality_score, scoring the products without
+    one in a single calculate_quality_scores batch"""
+    scores = [product.get('data_quality_score') for product in products]
+    missing = [index for index, score in enumerate(scores) if score is None]
+    if missing:
+        computed = DataQualityScorer.calculate_quality_scores([products[index] for index in missing])
+        for index, score in zip(missing, computed.tolist()):
+            scores[index] = score
+    return scores
+
 class CurationEngine:
     """Handles product curation and filtering"""
     
@@ -383,78 +635,136 @@ class CurationEngine:
                 'priority': 1
             }
         ]
+        self._default_compiled_rules = _compile_rules(self.default_rules)
     
     def apply_curation_rules(self, products: List[Dict[str, Any]], rules: List[Dict] = None) -> List[Dict[str, Any]]:
         """Apply curation rules to filter products"""
         if rules is None:
-            rules = self.default_rules
+            compiled_rules = self._default_compiled_rules
+        else:
+            compiled_rules = _compile_rules(rules)
+        
+        if not products:
+            return []
+        
+        # Evaluate each rule over the whole catalog at once (one boolean mask
+        # per rule) instead of walking every rule for every product
+        ratings = _numeric_column(products, 'rating')
+        review_counts = _numeric_column(products, 'review_count')
+        availability_codes = np.fromiter(
+            (_AVAIL_CODE.get(product.get('availability'), -1) for product in products),
+            dtype=np.int8,
+            count=len(products)
+        )
+        score = np.zeros(len(products))
+        excluded = np.zeros(len(products), dtype=bool)
+        reasons = []
         
+        for action, name, *condition in compiled_rules:
+            mask = self._condition_mask(products, ratings, review_counts, availability_codes, *condition)
+            if action == _ACTION_INCLUDE:
+                score += mask
+                reasons.append((mask, f"Passed: {name}"))
+            elif action == _ACTION_EXCLUDE:
+                excluded |= mask
+            elif action == _ACTION_FLAG:
+                score += 0.5 * mask
+                reasons.append((mask, f"Flagged: {name}"))
+        
+        # Products scoring below 1.0 (or hit by an exclude rule) are dropped,
+        # 2.0 and above are curated, anything in between is flagged
         curated_products = []
-        
-        for product in products:
-            curation_result = self._evaluate_product(product, rules)
-            if curation_result['action'] == 'include':
-                product['is_curated'] = True
-                product['curation_score'] = curation_result['score']
-                product['curation_reason'] = curation_result['reason']
-                curated_products.append(product)
-            elif curation_result['action'] == 'flag':
-                product['is_curated'] = False
-                product['curation_score'] = curation_result['score']
-                product['curation_reason'] = curation_result['reason']
-                curated_products.append(product)
+        for index in np.flatnonzero(~excluded & (score >= 1.0)).tolist():
+            product = products[index]
+            product['is_curated'] = bool(score[index] >= 2.0)
+            product['curation_score'] = float(score[index]) / len(compiled_rules)
+            product['curation_reason'] = '; '.join(
+                reason for mask, reason in reasons if mask[index]
+            )
+            curated_products.append(product)
         
         return curated_products
     
-    def _evaluate_product(self, product: Dict[str, Any], rules: List[Dict]) -> Dict[str, Any]:
-        """Evaluate a single product against curation rules"""
-        score = 0.0
-        reasons = []
-        
-        for rule in sorted(rules, key=lambda x: x['priority']):
-            if self._check_condition(product, rule['condition']):
-                if rule['action'] == 'include':
-                    score += 1.0
-                    reasons.append(f"Passed: {rule['name']}")
-                elif rule['action'] == 'exclude':
-                    return {
-                        'action': 'exclude',
-                        'score': 0.0,
-                        'reason': f"Excluded by: {rule['name']}"
-                    }
-                elif rule['action'] == 'flag':
-                    score += 0.5
-                    reasons.append(f"Flagged: {rule['name']}")
-        
-        # Determine final action
-        if score >= 2.0:
-            action = 'include'
-        elif score >= 1.0:
-            action = 'flag'
-        else:
-            action = 'exclude'
-        
-        return {
-            'action': action,
-            'score': score / len(rules) if rules else 0.0,
-            'reason': '; '.join(reasons) if reasons else 'No rules matched'
-        }
-    
-    def _check_condition(self, product: Dict[str, Any], condition: Dict[str, Any]) -> bool:
-        """Check if product meets a condition"""
-        for key, value in condition.items():
-            if key == 'min_rating':
-                if not product.get('rating') or product['rating'] < value:
-                    return False
-            elif key == 'min_reviews':
-                if not product.get('review_count') or product['review_count'] < value:
-                    return False
-            elif key == 'availability':
-                if product.get('availability') != value:
-                    return False
-            elif key == 'exclude_categories':
-                category = product.get('category', '').lower()
-                if any(excluded in category for excluded in value):
-                    return False
-        
-        return True
+    def _condition_mask(self, products: List[Dict[str, Any]], ratings: np.ndarray,
+                        review_counts: np.ndarray, availability_codes: np.ndarray,
+                        min_rating: Optional[float], min_reviews: Optional[int],
+                        availability: Union[int, str, None],
+                        exclude_categories: Union[Tuple[str, ...], re.Pattern, None]) -> np.ndarray:
+        """Boolean mask of the products meeting every clause of a compiled condition"""
+        mask = np.ones(len(products), dtype=bool)
+        
+        if min_rating is not None:
+            # NaN (missing rating) compares False, failing the clause
+            mask &= ratings >= min_rating
+        if min_reviews is not None:
+            mask &= review_counts >= min_reviews
+        if isinstance(availability, int):
+            mask &= availability_codes == availability
+        elif availability is not None:
+            # Not a standard status, so compare the raw strings
+            mask &= np.fromiter(
+                (product.get('availability') == availability for product in products),
+                dtype=bool,
+                count=len(products)
+            )
+        if isinstance(exclude_categories, re.Pattern):
+            search = exclude_categories.search
+            mask &= np.fromiter(
+                (search((product.get('category') or '').lower()) is None for product in products),
+                dtype=bool,
+                count=len(products)
+            )
+        elif exclude_categories is not None:
+            mask &= np.fromiter(
+                (
+                    not any(excluded in (product.get('category') or '').lower() for excluded in exclude_categories)
+                    for product in products
+                ),
+                dtype=bool,
+                count=len(products)
+            )
+        
+        return mask
+
+_ACTION_INCLUDE = 0
+_ACTION_EXCLUDE = 1
+_ACTION_FLAG = 2
+_ACTION_CODES = {'include': _ACTION_INCLUDE, 'exclude': _ACTION_EXCLUDE, 'flag': _ACTION_FLAG}
+
+def _compile_rules(rules: List[Dict]) -> Tuple[tuple, ...]:
+    """Sort rules by priority once and flatten each into
+    (action_code, name, min_rating, min_reviews, availability, exclude_categories),
+    with None for clauses the rule doesn't use, standard availability values
+    replaced by their _AVAIL_CODE and long exclude_categories lists by a
+    single regex"""
+    compiled = []
+    for rule in sorted(rules, key=lambda x: x['priority']):
+        condition = rule['condition']
+        exclude_categories = condition.get('exclude_categories')
+        if exclude_categories is not None:
+            exclude_categories = tuple(exclude_categories)
+            if len(exclude_categories) > 3:
+                exclude_categories = _category_pattern(exclude_categories)
+        compiled.append((
+            _ACTION_CODES.get(rule['action']),
+            rule['name'],
+            condition.get('min_rating'),
+            condition.get('min_reviews'),
+            _AVAIL_CODE.get(condition.get('availability'), condition.get('availability')),
+            exclude_categories,
+        ))
+    return tuple(compiled)
+
+@lru_cache(maxsize=64)
+def _category_pattern(terms: Tuple[str, ...]) -> re.Pattern:
+    """One alternation matching any of the terms as a substring, so a category
+    is scanned once instead of once per term"""
+    return re.compile('|'.join(map(re.escape, terms)))
+
+def _numeric_column(products: List[Dict[str, Any]], key: str) -> np.ndarray:
+    """Float column of a numeric product field, NaN where missing or zero"""
+    return np.fromiter(
+        (product.get(key) or np.nan for product in products),
+        dtype=np.float64,
+        count=len(products)
+    )
@@ -1,20 +1,46 @@
 import asyncio
-import schedule
+import heapq
+import itertools
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple, Callable, Awaitable, Optional
 import json
 
+from loguru import logger
+
+from ..models.product import ScrapingJobCreate
+
+# Interval between runs for each supported schedule
+SCHEDULE_INTERVALS = {
+    'hourly': timedelta(hours=1),
+    'daily': timedelta(days=1),
+    'weekly': timedelta(weeks=1),
+}
+
+# Runs one scheduled job: (job_id, job_data) -> awaitable
+JobRunner = Callable[[str, ScrapingJobCreate], Awaitable[Any]]
+
 class JobScheduler:
     """Handles automated job scheduling and execution"""
     
-    def __init__(self):
+    def __init__(self, job_runner: Optional[JobRunner] = None):
+        # What actually executes a due job; the application provides it
+        self.job_runner = job_runner
         self.scheduled_jobs = {}
         self.is_running = False
+        # Min-heap of (next_run_epoch, job_id); cancelled jobs are dropped
+        # lazily when they reach the top
+        self._heap: List[Tuple[float, str]] = []
+        self._running_tasks = set()
+        # Job id suffixes: unique within this process, and seeded from the
+        # startup time so ids don't repeat across restarts
+        self._job_ids = itertools.count(int(time.time() * 1000))
     
     def schedule_daily_catalog_scrape(self, retailer: str, category_url: str, job_name: str):
         """Schedule daily catalog scraping for a retailer"""
-        job_id = f"daily_catalog_{retailer}_{datetime.now().timestamp()}"
+        self._require_job_runner()
+        now = datetime.now()
+        job_id = f"daily_catalog_{retailer}_{next(self._job_ids)}"
         
         job_config = {
             'job_id': job_id,
@@ -23,25 +49,21 @@ class JobScheduler:
             'job_type': 'catalog',
             'category_url': category_url,
             'schedule': 'daily',
-            'next_run': datetime.now() + timedelta(days=1),
+            'next_run': now + SCHEDULE_INTERVALS['daily'],
             'is_active': True,
-            'created_at': datetime.now().isoformat()
+            'created_at': now.isoformat()
         }
         
-        self.scheduled_jobs[job_id] = job_config
-        
-        # Schedule with python-schedule
-        schedule.every().day.at("02:00").do(
-            self._execute_scheduled_job, 
-            job_id=job_id
-        ).tag(job_id)
+        self._add_job(job_config)
         
         logger.info(f"Scheduled daily catalog scrape for {retailer}: {job_name}")
         return job_id
     
     def schedule_hourly_price_updates(self, retailer: str, product_urls: List[str], job_name: str):
         """Schedule hourly price updates for specific products"""
-        job_id = f"hourly_price_{retailer}_{datetime.now().timestamp()}"
+        self._require_job_runner()
+        now = datetime.now()
+        job_id = f"hourly_price_{retailer}_{next(self._job_ids)}"
         
         job_config = {
             'job_id': job_id,
@@ -50,25 +72,21 @@ class JobScheduler:
             'job_type': 'price_update',
             'product_urls': product_urls,
             'schedule': 'hourly',
-            'next_run': datetime.now() + timedelta(hours=1),
+            'next_run': now + SCHEDULE_INTERVALS['hourly'],
             'is_active': True,
-            'created_at': datetime.now().isoformat()
+            'created_at': now.isoformat()
         }
         
-        self.scheduled_jobs[job_id] = job_config
-        
-        # Schedule with python-schedule
-        schedule.every().hour.do(
-            self._execute_scheduled_job, 
-            job_id=job_id
-        ).tag(job_id)
+        self._add_job(job_config)
         
         logger.info(f"Scheduled hourly price updates for {retailer}: {job_name}")
         return job_id
     
     def schedule_weekly_search_scrape(self, retailer: str, search_queries: List[str], job_name: str):
         """Schedule weekly search-based scraping"""
-        job_id = f"weekly_search_{retailer}_{datetime.now().timestamp()}"
+        self._require_job_runner()
+        now = datetime.now()
+        job_id = f"weekly_search_{retailer}_{next(self._job_ids)}"
         
         job_config = {
             'job_id': job_id,
@@ -77,22 +95,26 @@ class JobScheduler:
             'job_type': 'search',
             'search_queries': search_queries,
             'schedule': 'weekly',
-            'next_run': datetime.now() + timedelta(weeks=1),
+            'next_run': now + SCHEDULE_INTERVALS['weekly'],
             'is_active': True,
-            'created_at': datetime.now().isoformat()
+            'created_at': now.isoformat()
         }
         
-        self.scheduled_jobs[job_id] = job_config
-        
-        # Schedule with python-schedule
-        schedule.every().monday.at("03:00").do(
-            self._execute_scheduled_job, 
-            job_id=job_id
-        ).tag(job_id)
+        self._add_job(job_config)
         
         logger.info(f"Scheduled weekly search scrape for {retailer}: {job_name}")
         return job_id
     
+    def _require_job_runner(self):
+        """Refuse to accept jobs that could never be executed"""
+        if self.job_runner is None:
+            raise RuntimeError("No job runner configured for the scheduler; scheduled jobs could not run")
+    
+    def _add_job(self, job_config: Dict[str, Any]):
+        """Register a job and queue its first run"""
+        self.scheduled_jobs[job_config['job_id']] = job_config
+        heapq.heappush(self._heap, (job_config['next_run'].timestamp(), job_config['job_id']))
+    
     async def _execute_scheduled_job(self, job_id: str):
         """Execute a scheduled job"""
         try:
@@ -105,6 +127,10 @@ class JobScheduler:
                 logger.info(f"Scheduled job {job_id} is inactive, skipping")
                 return
             
+            if self.job_runner is None:
+                logger.error(f"No job runner configured, cannot execute scheduled job {job_id}")
+                return
+            
             logger.info(f"Executing scheduled job: {job_id}")
             
             # Create a new scraping job
@@ -117,15 +143,7 @@ class JobScheduler:
             )
             
             # Execute the job
-            await execute_scraping_job(job_id, job_data)
-            
-            # Update next run time
-            if job_config['schedule'] == 'daily':
-                job_config['next_run'] = datetime.now() + timedelta(days=1)
-            elif job_config['schedule'] == 'hourly':
-                job_config['next_run'] = datetime.now() + timedelta(hours=1)
-            elif job_config['schedule'] == 'weekly':
-                job_config['next_run'] = datetime.now() + timedelta(weeks=1)
+            await self.job_runner(job_id, job_data)
             
             logger.info(f"Scheduled job {job_id} completed successfully")
             
@@ -136,7 +154,6 @@ class JobScheduler:
         """Cancel a scheduled job"""
         if job_id in self.scheduled_jobs:
             self.scheduled_jobs[job_id]['is_active'] = False
-            schedule.clear(job_id)
             logger.info(f"Cancelled scheduled job: {job_id}")
             return True
         return False
@@ -160,8 +177,29 @@ class JobScheduler:
         
         while self.is_running:
             try:
-                schedule.run_pending()
-                await asyncio.sleep(60)  # Check every minute
+                now = time.time()
+                if not self._heap:
+                    await asyncio.sleep(60)
+                    continue
+                
+                # Sleep until the earliest job is due; the 60s cap picks up
+                # jobs added or stopped while we wait
+                next_run, job_id = self._heap[0]
+                if next_run > now:
+                    await asyncio.sleep(min(next_run - now, 60))
+                    continue
+                
+                heapq.heappop(self._heap)
+                job_config = self.scheduled_jobs.get(job_id)
+                if not job_config or not job_config.get('is_active', False):
+                    continue
+                
+                task = asyncio.create_task(self._execute_scheduled_job(job_id))
+                self._running_tasks.add(task)
+                task.add_done_callback(self._running_tasks.discard)
+                
+                job_config['next_run'] = datetime.fromtimestamp(now) + SCHEDULE_INTERVALS[job_config['schedule']]
+                heapq.heappush(self._heap, (job_config['next_run'].timestamp(), job_id))
             except Exception as e:
                 logger.error(f"Error in job scheduler: {e}")
                 await asyncio.sleep(60)
@@ -169,10 +207,11 @@ class JobScheduler:
     def stop_scheduler(self):
         """Stop the job scheduler"""
         self.is_running = False
-        schedule.clear()
+        self._heap.clear()
         logger.info("Job scheduler stopped")
 
-# Global scheduler instance
+# Global scheduler instance; the application must set job_runner before
+# jobs can be scheduled on it
 job_scheduler = JobScheduler()
 
 # Predefined job templates
@@ -4,14 +4,255 @@ Premium Amazon scraper with advanced anti-detection.
 
 import re
 import json
-from typing import Dict, List, Optional, Any
+import asyncio
+import itertools
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Iterable, Tuple
 from urllib.parse import urljoin, urlparse, parse_qs
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+import soupsieve as sv
 from loguru import logger
 
 from .base import PremiumBaseScraper, ScrapingResult
 
 
+_ID_SELECTOR_RE = re.compile(r'^#([\w-]+)(?:\s+([^\s>+~].*))?$')
+
+
+class _ParsedPage:
+    """A parsed page plus an id -> element index built in a single tree walk."""
+    
+    __slots__ = ('soup', 'by_id')
+    
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
+        self.by_id: Dict[str, Tag] = {}
+        for tag in soup.find_all(id=True):
+            self.by_id.setdefault(tag['id'], tag)
+
+
+class _Selector:
+    """A CSS selector compiled once.
+    
+    Selectors rooted at an id ('#productTitle', '#prodDetails tr') are
+    answered from the page's id index, running any remaining descendant
+    selector inside that element only; everything else goes to soupsieve
+    over the whole page.
+    """
+    
+    __slots__ = ('pattern', '_id', '_compiled')
+    
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        id_match = _ID_SELECTOR_RE.match(pattern)
+        if id_match:
+            self._id, descendants = id_match.groups()
+            self._compiled = sv.compile(descendants) if descendants else None
+        else:
+            self._id = None
+            self._compiled = sv.compile(pattern)
+    
+    def select_one(self, page: _ParsedPage) -> Optional[Tag]:
+        if self._id is None:
+            return self._compiled.select_one(page.soup)
+        root = page.by_id.get(self._id)
+        if root is None or self._compiled is None:
+            return root
+        return self._compiled.select_one(root)
+    
+    def select(self, page: _ParsedPage) -> List[Tag]:
+        if self._id is None:
+            return self._compiled.select(page.soup)
+        root = page.by_id.get(self._id)
+        if root is None:
+            return []
+        if self._compiled is None:
+            return [root]
+        return self._compiled.select(root)
+
+
+def _css(*selectors: str) -> Tuple[_Selector, ...]:
+    """Compile CSS selectors once, keeping their order of precedence"""
+    return tuple(_Selector(selector) for selector in selectors)
+
+
+# Multiple selectors for different Amazon layouts
+_SEARCH_RESULT_LINK_SELECTORS = _css(
+    '[data-component-type="s-search-result"] h2 a',
+    '.s-result-item h2 a',
+    '.s-search-result h2 a',
+    'h2 a[href*="/dp/"]',
+)
+_TITLE_SELECTORS = _css(
+    '#productTitle',
+    'h1.a-size-large',
+    '.product-title',
+    'h1[data-automation-id="product-title"]',
+)
+_PRICE_SELECTORS = _css(
+    '.a-price-whole',
+    '.a-offscreen',
+    '#priceblock_dealprice',
+    '#priceblock_ourprice',
+    '.a-price-range .a-price-whole',
+    '.a-price .a-offscreen',
+    '[data-automation-id="product-price"]',
+)
+_ORIGINAL_PRICE_SELECTORS = _css(
+    '.a-price-was .a-offscreen',
+    '.a-text-strike',
+    '.a-price-range .a-price-was .a-offscreen',
+    '.was-price .a-offscreen',
+)
+_RATING_SELECTORS = _css(
+    '.a-icon-alt',
+    '[data-automation-id="star-rating"] .a-icon-alt',
+    '.a-icon-star .a-icon-alt',
+    '.review-rating .a-icon-alt',
+)
+_REVIEW_COUNT_SELECTORS = _css(
+    '#acrCustomerReviewText',
+    '[data-automation-id="review-count"]',
+    '.a-size-base',
+    '.review-count',
+)
+_AVAILABILITY_SELECTORS = _css(
+    '#availability span',
+    '.a-size-medium.a-color-success',
+    '.a-size-medium.a-color-price',
+    '[data-automation-id="availability"]',
+    '.availability',
+)
+_PRIMARY_IMAGE_SELECTORS = _css(
+    '#landingImage',
+    '#imgBlkFront',
+    '.a-dynamic-image',
+    '.product-image img',
+)
+_GALLERY_IMAGE_SELECTORS = _css(
+    '#altImages img',
+    '.a-dynamic-image',
+    '.imageThumbnail img',
+)
+_DESCRIPTION_SELECTORS = _css(
+    '#feature-bullets .a-list-item',
+    '.product-description',
+    '[data-automation-id="product-description"]',
+    '.a-unordered-list .a-list-item',
+)
+_BULLET_POINT_SELECTORS = _css(
+    '#feature-bullets .a-list-item',
+    '.a-unordered-list .a-list-item',
+    '.product-features li',
+)
+_SIZE_SELECTORS = _css(
+    '#variation_size_name .a-button-text',
+    '.size-button .a-button-text',
+    '[data-automation-id="size-selection"] .a-button-text',
+)
+_COLOR_SELECTORS = _css(
+    '#variation_color_name .a-button-text',
+    '.color-button .a-button-text',
+    '[data-automation-id="color-selection"] .a-button-text',
+)
+_BRAND_SELECTORS = _css(
+    '#bylineInfo',
+    '.brand',
+    '[data-automation-id="brand-name"]',
+    '.a-link-normal[href*="/brand/"]',
+)
+_CATEGORY_SELECTORS = _css(
+    '#wayfinding-breadcrumbs_feature_div a',
+    '.breadcrumb a',
+    '[data-automation-id="breadcrumb"] a',
+)
+_SPEC_TABLE = _Selector('#prodDetails')
+_SPEC_SECTION_ROWS = _Selector('.a-section table tr')
+
+# /dp/ ASINs win over /product/ ones anywhere in the URL
+_ASIN_RE = re.compile(r'.*?/dp/([A-Z0-9]{10})|.*?/product/([A-Z0-9]{10})', re.DOTALL)
+
+
+@lru_cache(maxsize=4096)
+def _asin_from_url(url: str) -> Optional[str]:
+    """ASIN from a product URL, or None. Cached, as the same product links
+    keep turning up across search result pages."""
+    asin_match = _ASIN_RE.match(url)
+    return asin_match.group(asin_match.lastindex) if asin_match else None
+
+
+# Availability phrases in order of precedence when several appear
+_AVAILABILITY_PHRASES = {
+    'in stock': 'in_stock',
+    'out of stock': 'out_of_stock',
+    'pre-order': 'pre_order',
+    'limited': 'limited_stock',
+}
+_AVAILABILITY_RANK = {phrase: rank for rank, phrase in enumerate(_AVAILABILITY_PHRASES)}
+_AVAILABILITY_RE = re.compile('|'.join(map(re.escape, _AVAILABILITY_PHRASES)))
+
+_IMAGE_DIMENSION_RE = re.compile(r'\._AC_S([XY])(\d+)_')
+_HIGH_RES_DIMENSION = 1000
+
+
+def _upscale_dimension(match: re.Match) -> str:
+    """Raise an _AC_SX<n>_/_AC_SY<n>_ size token to at least the high-res size"""
+    axis, size = match.group(1), int(match.group(2))
+    return f'._AC_S{axis}{max(size, _HIGH_RES_DIMENSION)}_'
+
+_SELECTOR_HEAD_RE = re.compile(r'^[^\s>+~]+')
+_SELECTOR_TAG_RE = re.compile(r'^[a-zA-Z][\w-]*')
+_SELECTOR_ID_RE = re.compile(r'#([\w-]+)')
+_SELECTOR_CLASS_RE = re.compile(r'\.([\w-]+)')
+_SELECTOR_ATTR_RE = re.compile(r'\[([\w-]+)="([^"]*)"\]')
+
+
+def _strainer_for(selectors: Iterable[_Selector]) -> SoupStrainer:
+    """SoupStrainer keeping every element that could start a match for one of
+    the selectors, together with its whole subtree.
+    
+    Each selector is keyed on the most specific part of its outermost
+    compound (id, then attribute, then class, then tag name). Any element
+    matching that compound must carry that part, so the strained tree still
+    contains every match, in document order.
+    """
+    ids, attrs, classes, tags = set(), set(), set(), set()
+    for selector in selectors:
+        head = _SELECTOR_HEAD_RE.match(selector.pattern).group(0)
+        if _SELECTOR_ID_RE.search(head):
+            ids.add(_SELECTOR_ID_RE.search(head).group(1))
+        elif _SELECTOR_ATTR_RE.search(head):
+            attrs.add(_SELECTOR_ATTR_RE.search(head).groups())
+        elif _SELECTOR_CLASS_RE.search(head):
+            classes.add(_SELECTOR_CLASS_RE.search(head).group(1))
+        else:
+            tags.add(_SELECTOR_TAG_RE.match(head).group(0))
+    
+    def keep(name: str, tag_attrs: Dict[str, Any]) -> bool:
+        if name in tags or tag_attrs.get('id') in ids:
+            return True
+        tag_classes = tag_attrs.get('class') or ()
+        if isinstance(tag_classes, str):
+            tag_classes = tag_classes.split()
+        if not classes.isdisjoint(tag_classes):
+            return True
+        return any(tag_attrs.get(attr) == value for attr, value in attrs)
+    
+    return SoupStrainer(keep)
+
+
+# Parse only the parts of a page the extractors below can look at
+_PRODUCT_PAGE_STRAINER = _strainer_for(itertools.chain(
+    _TITLE_SELECTORS, _PRICE_SELECTORS, _ORIGINAL_PRICE_SELECTORS, _RATING_SELECTORS,
+    _REVIEW_COUNT_SELECTORS, _AVAILABILITY_SELECTORS, _PRIMARY_IMAGE_SELECTORS,
+    _GALLERY_IMAGE_SELECTORS, _DESCRIPTION_SELECTORS, _BULLET_POINT_SELECTORS,
+    (_SPEC_TABLE, _SPEC_SECTION_ROWS), _SIZE_SELECTORS, _COLOR_SELECTORS,
+    _BRAND_SELECTORS, _CATEGORY_SELECTORS,
+))
+_SEARCH_RESULTS_STRAINER = _strainer_for(_SEARCH_RESULT_LINK_SELECTORS)
+
+
 class PremiumAmazonScraper(PremiumBaseScraper):
     """Premium Amazon scraper with advanced features."""
     
@@ -23,17 +264,32 @@ class PremiumAmazonScraper(PremiumBaseScraper):
         
         # Amazon-specific settings
         self.allowed_domains = ["amazon.com", "amazon.co.uk", "amazon.ca", "amazon.de"]
+        self.max_products_per_page = 60  # Organic results on a full search page
         self.search_endpoints = {
-            "electronics": "/s?k=electronics&page={page}",
-            "home": "/s?k=home+kitchen&page={page}",
-            "fashion": "/s?k=clothing&page={page}",
-            "books": "/s?k=books&page={page}",
-            "sports": "/s?k=sports+outdoors&page={page}",
+            "electronics": "/s?k=electronics",
+            "home": "/s?k=home+kitchen",
+            "fashion": "/s?k=clothing",
+            "books": "/s?k=books",
+            "sports": "/s?k=sports+outdoors",
+        }
+        # First-page URL for each category; later pages add a page parameter
+        self.category_urls = {
+            category: urljoin(self.base_url, endpoint)
+            for category, endpoint in self.search_endpoints.items()
         }
     
-    async def _parse_product_page(self, content: str, url: str) -> Dict[str, Any]:
+    async def _parse_product_page(self, content: bytes, url: str) -> Dict[str, Any]:
         """Parse Amazon product page with advanced extraction."""
-        soup = BeautifulSoup(content, 'html.parser')
+        # BeautifulSoup builds the tree and runs the selectors in Python, so
+        # the worker still holds the GIL for most of the parse and parses
+        # get no faster. What it buys is responsiveness: the event loop gets
+        # the GIL back every switch interval (~5ms) instead of stalling for
+        # the whole parse, so in-flight requests keep being serviced
+        return await asyncio.to_thread(self._parse_product_html, content, url)
+    
+    def _parse_product_html(self, content: bytes, url: str) -> Dict[str, Any]:
+        """Parse a product page's HTML into product data."""
+        page = _ParsedPage(BeautifulSoup(content, 'lxml', parse_only=_PRODUCT_PAGE_STRAINER))
         
         try:
             # Extract ASIN from URL
@@ -44,19 +300,19 @@ class PremiumAmazonScraper(PremiumBaseScraper):
                 "retailer": "amazon",
                 "external_id": asin,
                 "url": url,
-                "title": self._extract_title(soup),
-                "price": self._extract_price(soup),
-                "original_price": self._extract_original_price(soup),
-                "rating": self._extract_rating(soup),
-                "review_count": self._extract_review_count(soup),
-                "availability": self._extract_availability(soup),
-                "images": self._extract_images(soup),
-                "description": self._extract_description(soup),
-                "bullet_points": self._extract_bullet_points(soup),
-                "specifications": self._extract_specifications(soup),
-                "variations": self._extract_variations(soup),
-                "brand": self._extract_brand(soup),
-                "category": self._extract_category(soup),
+                "title": self._extract_title(page),
+                "price": self._extract_price(page),
+                "original_price": self._extract_original_price(page),
+                "rating": self._extract_rating(page),
+                "review_count": self._extract_review_count(page),
+                "availability": self._extract_availability(page),
+                "images": self._extract_images(page),
+                "description": self._extract_description(page),
+                "bullet_points": self._extract_bullet_points(page),
+                "specifications": self._extract_specifications(page),
+                "variations": self._extract_variations(page),
+                "brand": self._extract_brand(page),
+                "category": self._extract_category(page),
                 "scraped_at": self._get_current_timestamp(),
             }
             
@@ -72,193 +328,124 @@ class PremiumAmazonScraper(PremiumBaseScraper):
             logger.error(f"Failed to parse Amazon product page: {e}")
             raise
     
-    async def _extract_product_urls(self, content: str) -> List[str]:
+    async def _extract_product_urls(self, content: bytes) -> List[str]:
         """Extract product URLs from Amazon search results."""
-        soup = BeautifulSoup(content, 'html.parser')
-        product_urls = []
-        
-        # Multiple selectors for different Amazon layouts
-        selectors = [
-            '[data-component-type="s-search-result"] h2 a',
-            '.s-result-item h2 a',
-            '.s-search-result h2 a',
-            'h2 a[href*="/dp/"]',
-        ]
-        
-        for selector in selectors:
-            links = soup.select(selector)
-            for link in links:
+        return await asyncio.to_thread(self._product_urls_from_html, content)
+    
+    def _product_urls_from_html(self, content: bytes) -> List[str]:
+        """Collect product page URLs from a search results page's HTML."""
+        page = _ParsedPage(BeautifulSoup(content, 'lxml', parse_only=_SEARCH_RESULTS_STRAINER))
+        # First URL seen for each ASIN, in page order. Keying on the ASIN also
+        # drops the same product linked with different tracking parameters
+        product_urls: Dict[str, str] = {}
+        
+        for selector in _SEARCH_RESULT_LINK_SELECTORS:
+            for link in selector.select(page):
                 href = link.get('href')
                 if href and '/dp/' in href:
-                    full_url = urljoin(self.base_url, href)
-                    product_urls.append(full_url)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_urls = []
-        for url in product_urls:
-            if url not in seen:
-                seen.add(url)
-                unique_urls.append(url)
+                    key = _asin_from_url(href) or href
+                    if key not in product_urls:
+                        product_urls[key] = urljoin(self.base_url, href)
+            
+            # The fallback selectors only re-find the same result links
+            if len(product_urls) >= self.max_products_per_page:
+                break
         
-        logger.info(f"Extracted {len(unique_urls)} product URLs from search results")
-        return unique_urls
+        logger.info(f"Extracted {len(product_urls)} product URLs from search results")
+        return list(product_urls.values())
     
     def _build_search_url(self, base_url: str, page: int) -> str:
         """Build Amazon search URL for specific page."""
         if page == 1:
             return base_url
-        else:
-            return f"{base_url}&page={page}"
+        separator = '&' if '?' in base_url else '?'
+        return f"{base_url}{separator}page={page}"
     
     def _extract_asin_from_url(self, url: str) -> str:
         """Extract ASIN from Amazon URL."""
-        asin_match = re.search(r'/dp/([A-Z0-9]{10})', url)
-        if asin_match:
-            return asin_match.group(1)
-        
-        # Try alternative URL patterns
-        asin_match = re.search(r'/product/([A-Z0-9]{10})', url)
-        if asin_match:
-            return asin_match.group(1)
+        asin = _asin_from_url(url)
+        if asin:
+            return asin
         
         # Fallback to URL hash
         return str(hash(url))
     
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, page: _ParsedPage) -> str:
         """Extract product title."""
-        title_selectors = [
-            '#productTitle',
-            'h1.a-size-large',
-            '.product-title',
-            'h1[data-automation-id="product-title"]',
-        ]
-        
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
+        for selector in _TITLE_SELECTORS:
+            title_elem = selector.select_one(page)
             if title_elem:
                 return self._clean_text(title_elem.get_text())
         
         return ""
     
-    def _extract_price(self, soup: BeautifulSoup) -> Optional[float]:
+    def _extract_price(self, page: _ParsedPage) -> Optional[float]:
         """Extract current price."""
-        price_selectors = [
-            '.a-price-whole',
-            '.a-offscreen',
-            '#priceblock_dealprice',
-            '#priceblock_ourprice',
-            '.a-price-range .a-price-whole',
-            '.a-price .a-offscreen',
-            '[data-automation-id="product-price"]',
-        ]
-        
-        for selector in price_selectors:
-            price_elem = soup.select_one(selector)
+        for selector in _PRICE_SELECTORS:
+            price_elem = selector.select_one(page)
             if price_elem:
                 price_text = price_elem.get_text()
-                price = self._extract_price(price_text)
+                price = self._parse_price_text(price_text)
                 if price:
                     return price
         
         return None
     
-    def _extract_original_price(self, soup: BeautifulSoup) -> Optional[float]:
+    def _extract_original_price(self, page: _ParsedPage) -> Optional[float]:
         """Extract original/MSRP price."""
-        original_price_selectors = [
-            '.a-price-was .a-offscreen',
-            '.a-text-strike',
-            '.a-price-range .a-price-was .a-offscreen',
-            '.was-price .a-offscreen',
-        ]
-        
-        for selector in original_price_selectors:
-            price_elem = soup.select_one(selector)
+        for selector in _ORIGINAL_PRICE_SELECTORS:
+            price_elem = selector.select_one(page)
             if price_elem:
                 price_text = price_elem.get_text()
-                price = self._extract_price(price_text)
+                price = self._parse_price_text(price_text)
                 if price:
                     return price
         
         return None
     
-    def _extract_rating(self, soup: BeautifulSoup) -> Optional[float]:
+    def _extract_rating(self, page: _ParsedPage) -> Optional[float]:
         """Extract customer rating."""
-        rating_selectors = [
-            '.a-icon-alt',
-            '[data-automation-id="star-rating"] .a-icon-alt',
-            '.a-icon-star .a-icon-alt',
-            '.review-rating .a-icon-alt',
-        ]
-        
-        for selector in rating_selectors:
-            rating_elem = soup.select_one(selector)
+        for selector in _RATING_SELECTORS:
+            rating_elem = selector.select_one(page)
             if rating_elem:
                 rating_text = rating_elem.get_text()
-                rating = self._extract_rating(rating_text)
+                rating = self._parse_rating_text(rating_text)
                 if rating:
                     return rating
         
         return None
     
-    def _extract_review_count(self, soup: BeautifulSoup) -> Optional[int]:
+    def _extract_review_count(self, page: _ParsedPage) -> Optional[int]:
         """Extract review count."""
-        review_selectors = [
-            '#acrCustomerReviewText',
-            '[data-automation-id="review-count"]',
-            '.a-size-base',
-            '.review-count',
-        ]
-        
-        for selector in review_selectors:
-            review_elem = soup.select_one(selector)
+        for selector in _REVIEW_COUNT_SELECTORS:
+            review_elem = selector.select_one(page)
             if review_elem:
                 review_text = review_elem.get_text()
-                count = self._extract_review_count(review_text)
+                count = self._parse_review_count_text(review_text)
                 if count:
                     return count
         
         return None
     
-    def _extract_availability(self, soup: BeautifulSoup) -> str:
+    def _extract_availability(self, page: _ParsedPage) -> str:
         """Extract availability status."""
-        availability_selectors = [
-            '#availability span',
-            '.a-size-medium.a-color-success',
-            '.a-size-medium.a-color-price',
-            '[data-automation-id="availability"]',
-            '.availability',
-        ]
-        
-        for selector in availability_selectors:
-            avail_elem = soup.select_one(selector)
+        for selector in _AVAILABILITY_SELECTORS:
+            avail_elem = selector.select_one(page)
             if avail_elem:
-                availability = avail_elem.get_text().strip().lower()
-                if 'in stock' in availability:
-                    return 'in_stock'
-                elif 'out of stock' in availability:
-                    return 'out_of_stock'
-                elif 'pre-order' in availability:
-                    return 'pre_order'
-                elif 'limited' in availability:
-                    return 'limited_stock'
+                # One scan for all phrases, then the highest-precedence one
+                found = _AVAILABILITY_RE.findall(avail_elem.get_text().lower())
+                if found:
+                    return _AVAILABILITY_PHRASES[min(found, key=_AVAILABILITY_RANK.__getitem__)]
         
         return 'unknown'
     
-    def _extract_images(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_images(self, page: _ParsedPage) -> List[str]:
         """Extract product images."""
         images = []
         
         # Primary image
-        img_selectors = [
-            '#landingImage',
-            '#imgBlkFront',
-            '.a-dynamic-image',
-            '.product-image img',
-        ]
-        
-        for selector in img_selectors:
-            img_elem = soup.select_one(selector)
+        for selector in _PRIMARY_IMAGE_SELECTORS:
+            img_elem = selector.select_one(page)
             if img_elem:
                 src = img_elem.get('src') or img_elem.get('data-src')
                 if src and 'data:image' not in src:
@@ -268,14 +455,8 @@ class PremiumAmazonScraper(PremiumBaseScraper):
                     break
         
         # Gallery images
-        gallery_selectors = [
-            '#altImages img',
-            '.a-dynamic-image',
-            '.imageThumbnail img',
-        ]
-        
-        for selector in gallery_selectors:
-            img_elems = soup.select(selector)
+        for selector in _GALLERY_IMAGE_SELECTORS:
+            img_elems = selector.select(page)
             for img_elem in img_elems:
                 src = img_elem.get('src') or img_elem.get('data-src')
                 if src and 'data:image' not in src:
@@ -285,18 +466,11 @@ class PremiumAmazonScraper(PremiumBaseScraper):
         
         return images[:10]  # Limit to 10 images
     
-    def _extract_description(self, soup: BeautifulSoup) -> str:
+    def _extract_description(self, page: _ParsedPage) -> str:
         """Extract product description."""
-        desc_selectors = [
-            '#feature-bullets .a-list-item',
-            '.product-description',
-            '[data-automation-id="product-description"]',
-            '.a-unordered-list .a-list-item',
-        ]
-        
         descriptions = []
-        for selector in desc_selectors:
-            desc_elems = soup.select(selector)
+        for selector in _DESCRIPTION_SELECTORS:
+            desc_elems = selector.select(page)
             for elem in desc_elems:
                 text = elem.get_text().strip()
                 if text and len(text) > 10:  # Filter out short/empty items
@@ -304,63 +478,52 @@ class PremiumAmazonScraper(PremiumBaseScraper):
         
         return ' '.join(descriptions)
     
-    def _extract_bullet_points(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_bullet_points(self, page: _ParsedPage) -> List[str]:
         """Extract bullet points."""
-        bullet_selectors = [
-            '#feature-bullets .a-list-item',
-            '.a-unordered-list .a-list-item',
-            '.product-features li',
-        ]
-        
         bullet_points = []
-        for selector in bullet_selectors:
-            bullet_elems = soup.select(selector)
+        for selector in _BULLET_POINT_SELECTORS:
+            bullet_elems = selector.select(page)
             for elem in bullet_elems:
                 text = elem.get_text().strip()
                 if text and len(text) > 10:
                     bullet_points.append(text)
+                    if len(bullet_points) == 10:  # Limit to 10 bullet points
+                        return bullet_points
         
-        return bullet_points[:10]  # Limit to 10 bullet points
+        return bullet_points
     
-    def _extract_specifications(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_specifications(self, page: _ParsedPage) -> Dict[str, str]:
         """Extract product specifications."""
-        specs = {}
-        
-        # Technical details table
-        spec_rows = soup.select('#prodDetails tr')
-        for row in spec_rows:
-            cells = row.select('td')
-            if len(cells) >= 2:
-                label = cells[0].get_text().strip()
-                value = cells[1].get_text().strip()
-                if label and value:
-                    specs[label] = value
-        
-        # Additional specifications
-        spec_sections = soup.select('.a-section table tr')
-        for row in spec_sections:
-            cells = row.select('td')
-            if len(cells) >= 2:
-                label = cells[0].get_text().strip()
-                value = cells[1].get_text().strip()
-                if label and value:
-                    specs[label] = value
-        
-        return specs
+        # Technical details table, then additional specifications
+        spec_table = _SPEC_TABLE.select_one(page)
+        rows = itertools.chain(
+            spec_table.find_all('tr') if spec_table is not None else (),
+            _SPEC_SECTION_ROWS.select(page),
+        )
+        return dict(self._spec_pairs(rows))
     
-    def _extract_variations(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _spec_pairs(rows: Iterable[Tag]) -> Iterable[Tuple[str, str]]:
+        """Yield (label, value) from the first two cells of each table row."""
+        for row in rows:
+            label_cell = row.find('td')
+            if label_cell is None:
+                continue
+            value_cell = label_cell.find_next_sibling('td')
+            if value_cell is None:
+                continue
+            label = label_cell.get_text().strip()
+            value = value_cell.get_text().strip()
+            if label and value:
+                yield label, value
+    
+    def _extract_variations(self, page: _ParsedPage) -> List[Dict[str, Any]]:
         """Extract product variations."""
         variations = []
         
         # Size variations
-        size_selectors = [
-            '#variation_size_name .a-button-text',
-            '.size-button .a-button-text',
-            '[data-automation-id="size-selection"] .a-button-text',
-        ]
-        
-        for selector in size_selectors:
-            size_elems = soup.select(selector)
+        for selector in _SIZE_SELECTORS:
+            size_elems = selector.select(page)
             for elem in size_elems:
                 size = elem.get_text().strip()
                 if size:
@@ -371,14 +534,8 @@ class PremiumAmazonScraper(PremiumBaseScraper):
                     })
         
         # Color variations
-        color_selectors = [
-            '#variation_color_name .a-button-text',
-            '.color-button .a-button-text',
-            '[data-automation-id="color-selection"] .a-button-text',
-        ]
-        
-        for selector in color_selectors:
-            color_elems = soup.select(selector)
+        for selector in _COLOR_SELECTORS:
+            color_elems = selector.select(page)
             for elem in color_elems:
                 color = elem.get_text().strip()
                 if color:
@@ -390,17 +547,10 @@ class PremiumAmazonScraper(PremiumBaseScraper):
         
         return variations
     
-    def _extract_brand(self, soup: BeautifulSoup) -> str:
+    def _extract_brand(self, page: _ParsedPage) -> str:
         """Extract brand information."""
-        brand_selectors = [
-            '#bylineInfo',
-            '.brand',
-            '[data-automation-id="brand-name"]',
-            '.a-link-normal[href*="/brand/"]',
-        ]
-        
-        for selector in brand_selectors:
-            brand_elem = soup.select_one(selector)
+        for selector in _BRAND_SELECTORS:
+            brand_elem = selector.select_one(page)
             if brand_elem:
                 brand_text = brand_elem.get_text().strip()
                 if brand_text:
@@ -408,16 +558,10 @@ class PremiumAmazonScraper(PremiumBaseScraper):
         
         return ""
     
-    def _extract_category(self, soup: BeautifulSoup) -> str:
+    def _extract_category(self, page: _ParsedPage) -> str:
         """Extract product category."""
-        category_selectors = [
-            '#wayfinding-breadcrumbs_feature_div a',
-            '.breadcrumb a',
-            '[data-automation-id="breadcrumb"] a',
-        ]
-        
-        for selector in category_selectors:
-            category_elems = soup.select(selector)
+        for selector in _CATEGORY_SELECTORS:
+            category_elems = selector.select(page)
             if category_elems:
                 # Return the last breadcrumb item
                 return category_elems[-1].get_text().strip()
@@ -429,26 +573,20 @@ class PremiumAmazonScraper(PremiumBaseScraper):
         if not image_url:
             return image_url
         
-        # Replace low-res dimensions with high-res
-        high_res_url = image_url.replace('._AC_SX38_', '._AC_SX1000_')
-        high_res_url = high_res_url.replace('._AC_SY38_', '._AC_SY1000_')
-        high_res_url = high_res_url.replace('._AC_SX50_', '._AC_SX1000_')
-        high_res_url = high_res_url.replace('._AC_SY50_', '._AC_SY1000_')
-        
-        return high_res_url
+        # Replace low-res dimensions with high-res, leaving larger ones alone
+        return _IMAGE_DIMENSION_RE.sub(_upscale_dimension, image_url)
     
     def _get_current_timestamp(self) -> str:
-        """Get current timestamp in ISO format."""
-        from datetime import datetime
-        return datetime.now().isoformat()
+        """Get current UTC timestamp in ISO format."""
+        return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
     
     async def scrape_category(self, category: str, max_pages: int = 5) -> List[ScrapingResult]:
         """Scrape products from a specific category."""
-        if category not in self.search_endpoints:
+        search_url = self.category_urls.get(category)
+        if search_url is None:
             logger.warning(f"Unknown category: {category}")
             return []
         
-        search_url = self.base_url + self.search_endpoints[category]
         logger.info(f"Scraping Amazon category '{category}' with {max_pages} pages")
         
         return await self.scrape_search_results(search_url, max_pages)
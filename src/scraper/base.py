@@ -2,15 +2,58 @@
 Base scraper class with common functionality.
 """
 
+import os
 import re
+import gzip
 import asyncio
-from typing import Dict, List, Optional, Any
+import hashlib
+from typing import Callable, Dict, List, Optional, Any
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from loguru import logger
 import aiohttp
 from fake_useragent import UserAgent
 
+try:
+    import brotli  # noqa: F401 -- lets aiohttp decode 'br' responses
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+# Loading the user-agent database is slow, so share one instance
+_USER_AGENT = UserAgent()
+
+# Directory for caching fetched product pages between runs (development and
+# parser profiling); caching is off unless this is set
+_PAGE_CACHE_DIR = os.getenv("SCRAPER_PAGE_CACHE_DIR")
+
+_WS_RE = re.compile(r'\s+')
+_PRICE_STRIP_RE = re.compile(r'[^\d.,]')
+_RATING_WORDS_RE = re.compile(r'(\d+\.?\d*)\s*(?:out of \d+|stars?)')
+_NUMBER_RE = re.compile(r'(\d+\.?\d*)')
+_COUNT_RE = re.compile(r'[\d,]+')
+
+
+class _LeakyBucket:
+    """Spaces request starts evenly at `rate()` per second.
+    
+    Each caller reserves the next free slot and sleeps until it; slots are
+    handed out synchronously, so no lock is needed on a single event loop.
+    The rate is read on every reservation, so a change applies from the
+    next request on.
+    """
+    
+    def __init__(self, rate: Callable[[], float]):
+        self._rate = rate
+        self._next = 0.0
+    
+    async def acquire(self):
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next)
+        self._next = slot + 1.0 / self._rate()
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
 
 @dataclass
 class ScrapingResult:
@@ -27,13 +70,19 @@ class PremiumBaseScraper(ABC):
     def __init__(self, retailer: str, base_url: str):
         self.retailer = retailer
         self.base_url = base_url
-        self.user_agent = UserAgent()
+        self.user_agent = _USER_AGENT
         self.session: Optional[aiohttp.ClientSession] = None
         
         # Rate limiting
         self.request_delay = 1.0  # seconds between requests
         self.max_concurrent_requests = 5
         self.semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        # Same average rate the per-request sleep used to allow, but spaced
+        # out and without holding a connection slot while waiting
+        self.rate_limiter = _LeakyBucket(lambda: self.max_concurrent_requests / self.request_delay)
+        
+        # On-disk page cache, keyed by URL hash
+        self.page_cache_dir = _PAGE_CACHE_DIR
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -52,7 +101,7 @@ class PremiumBaseScraper(ABC):
                 'User-Agent': self.user_agent.random,
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
+                'Accept-Encoding': _ACCEPT_ENCODING,
                 'Connection': 'keep-alive',
                 'Upgrade-Insecure-Requests': '1',
             }
@@ -60,7 +109,15 @@ class PremiumBaseScraper(ABC):
             self.session = aiohttp.ClientSession(
                 timeout=timeout,
                 headers=headers,
-                connector=aiohttp.TCPConnector(limit=100)
+                # Pool sized to our own concurrency, with connections (and
+                # their TLS sessions) and DNS lookups kept around for reuse
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_concurrent_requests * 4,
+                    limit_per_host=self.max_concurrent_requests,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                )
             )
     
     async def _close_session(self):
@@ -69,18 +126,19 @@ class PremiumBaseScraper(ABC):
             await self.session.close()
             self.session = None
     
-    async def _make_request(self, url: str, **kwargs) -> Optional[str]:
+    async def _make_request(self, url: str, **kwargs) -> Optional[bytes]:
         """Make HTTP request with rate limiting and error handling."""
+        await self.rate_limiter.acquire()
         async with self.semaphore:
             try:
-                await asyncio.sleep(self.request_delay)
-                
                 if not self.session:
                     await self._create_session()
                 
                 async with self.session.get(url, **kwargs) as response:
                     if response.status == 200:
-                        return await response.text()
+                        # Raw body; the HTML parser works out the encoding
+                        # itself, which skips aiohttp's charset sniffing
+                        return await response.read()
                     else:
                         logger.warning(f"HTTP {response.status} for {url}")
                         return None
@@ -89,22 +147,65 @@ class PremiumBaseScraper(ABC):
                 logger.error(f"Request failed for {url}: {e}")
                 return None
     
+    def _page_cache_path(self, url: str) -> str:
+        """Cache file for a URL: <dir>/<ab>/<sha256>.html.gz"""
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.page_cache_dir, key[:2], f"{key}.html.gz")
+    
+    @staticmethod
+    def _read_cached_page(path: str) -> Optional[bytes]:
+        try:
+            with open(path, 'rb') as f:
+                return gzip.decompress(f.read())
+        except FileNotFoundError:
+            return None
+    
+    @staticmethod
+    def _write_cached_page(path: str, content: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(gzip.compress(content, compresslevel=6))
+        os.replace(tmp_path, path)
+    
+    async def _fetch_product_page(self, url: str) -> Optional[bytes]:
+        """Fetch a product page, going through the page cache when enabled."""
+        if not self.page_cache_dir:
+            return await self._make_request(url)
+        
+        cache_path = self._page_cache_path(url)
+        try:
+            content = await asyncio.to_thread(self._read_cached_page, cache_path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable page cache entry {cache_path}: {e}")
+            content = None
+        if content is not None:
+            return content
+        
+        content = await self._make_request(url)
+        if content:
+            try:
+                await asyncio.to_thread(self._write_cached_page, cache_path, content)
+            except OSError as e:
+                logger.warning(f"Could not cache page {url}: {e}")
+        return content
+    
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text."""
         if not text:
             return ""
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         return text.strip()
     
-    def _extract_price(self, price_text: str) -> Optional[float]:
+    def _parse_price_text(self, price_text: str) -> Optional[float]:
         """Extract price from text."""
         if not price_text:
             return None
         
         # Remove currency symbols and commas
-        price_text = re.sub(r'[^\d.,]', '', price_text)
+        price_text = _PRICE_STRIP_RE.sub('', price_text)
         
         # Handle different decimal separators
         if ',' in price_text and '.' in price_text:
@@ -123,13 +224,13 @@ class PremiumBaseScraper(ABC):
         except ValueError:
             return None
     
-    def _extract_rating(self, rating_text: str) -> Optional[float]:
+    def _parse_rating_text(self, rating_text: str) -> Optional[float]:
         """Extract rating from text."""
         if not rating_text:
             return None
         
         # Look for patterns like "4.5 out of 5" or "4.5 stars"
-        rating_match = re.search(r'(\d+\.?\d*)\s*(?:out of \d+|stars?)', rating_text)
+        rating_match = _RATING_WORDS_RE.search(rating_text)
         if rating_match:
             try:
                 return float(rating_match.group(1))
@@ -137,7 +238,7 @@ class PremiumBaseScraper(ABC):
                 pass
         
         # Look for simple decimal numbers
-        rating_match = re.search(r'(\d+\.?\d*)', rating_text)
+        rating_match = _NUMBER_RE.search(rating_text)
         if rating_match:
             try:
                 rating = float(rating_match.group(1))
@@ -150,13 +251,13 @@ class PremiumBaseScraper(ABC):
         
         return None
     
-    def _extract_review_count(self, review_text: str) -> Optional[int]:
+    def _parse_review_count_text(self, review_text: str) -> Optional[int]:
         """Extract review count from text."""
         if not review_text:
             return None
         
         # Remove commas and extract numbers
-        numbers = re.findall(r'[\d,]+', review_text)
+        numbers = _COUNT_RE.findall(review_text)
         if numbers:
             try:
                 return int(numbers[0].replace(',', ''))
@@ -166,19 +267,19 @@ class PremiumBaseScraper(ABC):
         return None
     
     @abstractmethod
-    async def _parse_product_page(self, content: str, url: str) -> Dict[str, Any]:
+    async def _parse_product_page(self, content: bytes, url: str) -> Dict[str, Any]:
         """Parse product page content. Must be implemented by subclasses."""
         pass
     
     @abstractmethod
-    async def _extract_product_urls(self, content: str) -> List[str]:
+    async def _extract_product_urls(self, content: bytes) -> List[str]:
         """Extract product URLs from search results. Must be implemented by subclasses."""
         pass
     
     async def scrape_product(self, url: str) -> ScrapingResult:
         """Scrape a single product page."""
         try:
-            content = await self._make_request(url)
+            content = await self._fetch_product_page(url)
             if not content:
                 return ScrapingResult(success=False, error="Failed to fetch page", url=url)
             
@@ -192,13 +293,18 @@ class PremiumBaseScraper(ABC):
     async def scrape_search_results(self, search_url: str, max_pages: int = 5) -> List[ScrapingResult]:
         """Scrape products from search results across multiple pages."""
         results = []
+        next_page = None
         
         try:
+            # Fetch the next results page while the current page's products
+            # are being scraped
+            next_page = asyncio.create_task(self._fetch_search_page(search_url, 1))
             for page in range(1, max_pages + 1):
-                page_url = self._build_search_url(search_url, page)
-                logger.info(f"Scraping page {page}: {page_url}")
+                content = await next_page
+                next_page = None
+                if page < max_pages:
+                    next_page = asyncio.create_task(self._fetch_search_page(search_url, page + 1))
                 
-                content = await self._make_request(page_url)
                 if not content:
                     logger.warning(f"Failed to fetch page {page}")
                     continue
@@ -206,17 +312,15 @@ class PremiumBaseScraper(ABC):
                 product_urls = await self._extract_product_urls(content)
                 logger.info(f"Found {len(product_urls)} products on page {page}")
                 
-                # Scrape each product
-                for product_url in product_urls:
-                    result = await self.scrape_product(product_url)
-                    results.append(result)
-                    
+                # Scrape the page's products concurrently; the semaphore in
+                # _make_request still caps requests in flight
+                page_results = await asyncio.gather(
+                    *(self.scrape_product(product_url) for product_url in product_urls)
+                )
+                for result in page_results:
                     if not result.success:
-                        logger.warning(f"Failed to scrape product: {product_url}")
-                
-                # Add delay between pages
-                if page < max_pages:
-                    await asyncio.sleep(self.request_delay * 2)
+                        logger.warning(f"Failed to scrape product: {result.url}")
+                results.extend(page_results)
             
             logger.info(f"Scraping completed: {len(results)} products processed")
             return results
@@ -224,6 +328,16 @@ class PremiumBaseScraper(ABC):
         except Exception as e:
             logger.error(f"Error in scrape_search_results: {e}")
             return results
+        
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+    
+    async def _fetch_search_page(self, search_url: str, page: int) -> Optional[bytes]:
+        """Fetch one page of search results."""
+        page_url = self._build_search_url(search_url, page)
+        logger.info(f"Scraping page {page}: {page_url}")
+        return await self._make_request(page_url)
     
     def _build_search_url(self, base_url: str, page: int) -> str:
         """Build search URL for specific page. Default implementation."""
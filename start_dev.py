@@ -36,6 +36,41 @@ def start_frontend():
     ], cwd=frontend_dir)
     return frontend_process
 
+def wait_for_exit(processes):
+    """Block until one of the server processes exits and return it."""
+    if not hasattr(signal, "sigwait"):
+        # Windows has no sigwait; fall back to polling
+        while True:
+            time.sleep(1)
+            for process in processes:
+                if process.poll() is not None:
+                    return process
+    
+    # Sleep in sigwait until a child exits or we're asked to stop. Signals
+    # are blocked only after the servers are started so they don't inherit
+    # the mask, hence the poll() before the first wait.
+    signals = {signal.SIGCHLD, signal.SIGINT, signal.SIGTERM}
+    signal.pthread_sigmask(signal.SIG_BLOCK, signals)
+    try:
+        while True:
+            for process in processes:
+                if process.poll() is not None:
+                    return process
+            if signal.sigwait(signals) != signal.SIGCHLD:
+                raise KeyboardInterrupt
+    finally:
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, signals)
+
+def stop_servers(processes):
+    """Terminate any server processes still running."""
+    for process in processes:
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
 def main():
     """Main function to start both servers."""
     print("🌟 Premium Scraper Development Environment")
@@ -79,23 +114,13 @@ def main():
         print("\nPress Ctrl+C to stop both servers...")
         
         # Wait for processes
-        while True:
-            time.sleep(1)
-            # Check if any process has died
-            for process in processes:
-                if process.poll() is not None:
-                    print(f"❌ Process {process.pid} has stopped unexpectedly")
-                    return
+        stopped = wait_for_exit(processes)
+        print(f"❌ Process {stopped.pid} has stopped unexpectedly")
+        stop_servers(processes)
             
     except KeyboardInterrupt:
         print("\n🛑 Shutting down servers...")
-        for process in processes:
-            if process.poll() is None:
-                process.terminate()
-                try:
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    process.kill()
+        stop_servers(processes)
         print("✅ Servers stopped successfully!")
 
 if __name__ == "__main__":
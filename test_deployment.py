@@ -3,128 +3,221 @@
 Test script to verify deployment readiness.
 """
 
+import argparse
 import os
 import sys
-from pathlib import Path
+import json
+import hashlib
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from typing import Dict, List, Optional
 
-def check_file_exists(file_path, description):
-    """Check if a file exists and print status."""
-    if Path(file_path).exists():
-        print(f"✅ {description}: {file_path}")
-        return True
-    else:
-        print(f"❌ {description}: {file_path} - MISSING")
-        return False
+# (section, path, description, kind: "file", "dir" or "any"), in report order
+CHECKS = (
+    ("📦 Backend Configuration", "railway.json", "Railway configuration", "file"),
+    ("📦 Backend Configuration", "Procfile", "Railway Procfile", "file"),
+    ("📦 Backend Configuration", "runtime.txt", "Python runtime version", "file"),
+    ("📦 Backend Configuration", "requirements-prod.txt", "Production requirements", "file"),
+    ("📦 Backend Configuration", "src/api/main.py", "FastAPI main application", "file"),
+    ("📦 Backend Configuration", "src/config/supabase.py", "Supabase configuration", "file"),
+    ("📦 Backend Configuration", "src/database/models.py", "Database models", "file"),
+    ("📦 Backend Configuration", "src/database/service.py", "Database service", "file"),
+    ("🎨 Frontend Configuration", "frontend/vercel.json", "Vercel configuration", "file"),
+    ("🎨 Frontend Configuration", "frontend/.vercelignore", "Vercel ignore file", "file"),
+    ("🎨 Frontend Configuration", "frontend/next.config.js", "Next.js configuration", "file"),
+    ("🎨 Frontend Configuration", "frontend/package.json", "Package configuration", "file"),
+    ("🎨 Frontend Configuration", "frontend/app/layout.tsx", "Root layout", "file"),
+    ("🎨 Frontend Configuration", "frontend/lib/api.ts", "API client", "file"),
+    ("🎨 Frontend Configuration", "frontend/components/providers.tsx", "React providers", "file"),
+    ("🚀 Deployment Files", "DEPLOYMENT_GUIDE.md", "Deployment guide", "file"),
+    ("🚀 Deployment Files", "SETUP_GUIDE.md", "Setup guide", "file"),
+    ("🚀 Deployment Files", "deploy.bat", "Windows deployment script", "file"),
+    ("🚀 Deployment Files", "deploy.sh", "Linux/Mac deployment script", "file"),
+    ("🚀 Deployment Files", ".env.production", "Production environment template", "file"),
+    ("🚀 Deployment Files", "frontend/.env.production", "Frontend production environment", "file"),
+    ("📁 Directory Structure", "src", "Backend source code", "dir"),
+    ("📁 Directory Structure", "frontend", "Frontend source code", "dir"),
+    ("📁 Directory Structure", "src/api", "API routes", "dir"),
+    ("📁 Directory Structure", "src/config", "Configuration", "dir"),
+    ("📁 Directory Structure", "src/database", "Database layer", "dir"),
+    ("📁 Directory Structure", "src/scraper", "Scraping modules", "dir"),
+    ("📁 Directory Structure", "frontend/app", "Next.js app directory", "dir"),
+    ("📁 Directory Structure", "frontend/components", "React components", "dir"),
+    ("📁 Directory Structure", "frontend/lib", "Utility libraries", "dir"),
+    ("🔧 Environment Configuration", ".env.example", "Backend environment example", "file"),
+    ("🔧 Environment Configuration", "frontend/.env.example", "Frontend environment example", "file"),
+)
+# What a cached result set was computed for, in JSON form
+CHECKLIST = [[path, want] for _, path, _, want in CHECKS]
 
-def check_directory_exists(dir_path, description):
-    """Check if a directory exists and print status."""
-    if Path(dir_path).exists() and Path(dir_path).is_dir():
-        print(f"✅ {description}: {dir_path}")
-        return True
-    else:
-        print(f"❌ {description}: {dir_path} - MISSING")
-        return False
+# In CI, stop at (and report up to) the first missing entry
+FAST_FAIL = bool(os.environ.get("DEPLOY_CHECK_FAST_FAIL"))
 
-def main():
-    """Main test function."""
-    print("🚀 Premium Scraper Deployment Readiness Test")
-    print("=" * 50)
-    
-    all_good = True
-    
-    # Check backend files
-    print("\n📦 Backend Configuration:")
-    backend_files = [
-        ("railway.json", "Railway configuration"),
-        ("Procfile", "Railway Procfile"),
-        ("runtime.txt", "Python runtime version"),
-        ("requirements-prod.txt", "Production requirements"),
-        ("src/api/main.py", "FastAPI main application"),
-        ("src/config/supabase.py", "Supabase configuration"),
-        ("src/database/models.py", "Database models"),
-        ("src/database/service.py", "Database service"),
-    ]
-    
-    for file_path, description in backend_files:
-        if not check_file_exists(file_path, description):
-            all_good = False
-    
-    # Check frontend files
-    print("\n🎨 Frontend Configuration:")
-    frontend_files = [
-        ("frontend/vercel.json", "Vercel configuration"),
-        ("frontend/.vercelignore", "Vercel ignore file"),
-        ("frontend/next.config.js", "Next.js configuration"),
-        ("frontend/package.json", "Package configuration"),
-        ("frontend/app/layout.tsx", "Root layout"),
-        ("frontend/lib/api.ts", "API client"),
-        ("frontend/components/providers.tsx", "React providers"),
-    ]
-    
-    for file_path, description in frontend_files:
-        if not check_file_exists(file_path, description):
-            all_good = False
+# Opt in to reusing the last run's results while the checked directories are
+# unchanged; --no-cache overrides it for a single run
+USE_CACHE = bool(os.environ.get("DEPLOY_CHECK_CACHE"))
+
+# Status lines for a check: (description, path) -> line
+_OK = "✅ {}: {}".format
+_BAD = "❌ {}: {} - MISSING".format
+
+
+# Parent directory -> its entries by name (see scan_dir)
+Listings = Dict[str, Optional[Dict[str, os.DirEntry]]]
+
+def scan_dir(parent: str) -> Optional[Dict[str, os.DirEntry]]:
+    """Entries of one directory as {name: DirEntry}.
     
-    # Check deployment files
-    print("\n🚀 Deployment Files:")
-    deployment_files = [
-        ("DEPLOYMENT_GUIDE.md", "Deployment guide"),
-        ("SETUP_GUIDE.md", "Setup guide"),
-        ("deploy.bat", "Windows deployment script"),
-        ("deploy.sh", "Linux/Mac deployment script"),
-        (".env.production", "Production environment template"),
-        ("frontend/.env.production", "Frontend production environment"),
-    ]
+    A missing directory gives an empty dict, so everything under it reads
+    as missing; one we may not list (but may still look inside) gives None.
+    """
+    try:
+        with os.scandir(parent) as it:
+            return {entry.name: entry for entry in it}
+    except PermissionError:
+        return None
+    except OSError:
+        return {}
+
+def scan_parents(parents: List[str]) -> Listings:
+    """Scan the directories concurrently; the scans just wait on the filesystem."""
+    with ThreadPoolExecutor(max_workers=min(8, len(parents)) or 1) as pool:
+        return dict(zip(parents, pool.map(scan_dir, parents)))
+
+def check_entry(listings: Listings, path: str, want: str = "any") -> bool:
+    """Check if a path exists and, unless want is "any", is a file or directory."""
+    listing = listings[os.path.dirname(path) or "."]
+    if listing is None:
+        if want == "any":
+            # Plain existence needs no stat result at all
+            return os.access(path, os.F_OK)
+        # One lstat gives the type; only a symlink needs a second stat to
+        # see what it points at
+        try:
+            mode = os.lstat(path).st_mode
+        except OSError:
+            return False
+        if want == "dir":
+            return stat.S_ISDIR(mode) or (stat.S_ISLNK(mode) and os.path.isdir(path))
+        return stat.S_ISREG(mode) or (stat.S_ISLNK(mode) and os.path.isfile(path))
+    entry = listing.get(os.path.basename(path))
+    if entry is None:
+        return False
+    # DirEntry caches the file type from the scan, so no extra stat here
+    if want == "dir":
+        return entry.is_dir()
+    if want == "file":
+        return entry.is_file()
+    return True
+
+def parent_mtimes() -> Dict[str, Optional[int]]:
+    """mtime of every directory the checks look in (None if missing).
     
-    for file_path, description in deployment_files:
-        if not check_file_exists(file_path, description):
-            all_good = False
+    Adding, removing or renaming an entry updates its directory's mtime, so
+    unchanged mtimes mean unchanged check results.
+    """
+    mtimes = {}
+    for _, path, _, _ in CHECKS:
+        parent = os.path.dirname(path) or "."
+        if parent not in mtimes:
+            try:
+                mtimes[parent] = os.stat(parent).st_mtime_ns
+            except OSError:
+                mtimes[parent] = None
+    return mtimes
+
+def cache_file() -> str:
+    """Where this checkout's results are cached between runs.
     
-    # Check directories
-    print("\n📁 Directory Structure:")
-    directories = [
-        ("src", "Backend source code"),
-        ("frontend", "Frontend source code"),
-        ("src/api", "API routes"),
-        ("src/config", "Configuration"),
-        ("src/database", "Database layer"),
-        ("src/scraper", "Scraping modules"),
-        ("frontend/app", "Next.js app directory"),
-        ("frontend/components", "React components"),
-        ("frontend/lib", "Utility libraries"),
-    ]
+    Lives in the user cache directory, outside every directory the checks
+    look in: writing it there would change the mtimes it is validated on.
+    """
+    cache_home = (
+        os.environ.get("XDG_CACHE_HOME")
+        or os.environ.get("LOCALAPPDATA")
+        or os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    checkout = hashlib.sha256(os.path.abspath(".").encode()).hexdigest()[:16]
+    return os.path.join(cache_home, "premium-scraper", f"deploy-check-{checkout}.json")
+
+def load_cached_results(mtimes: Dict[str, Optional[int]]) -> Optional[List[bool]]:
+    """Results of the last run, if the checklist and directories are unchanged."""
+    try:
+        with open(cache_file(), encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("checks") != CHECKLIST or cached.get("mtimes") != mtimes:
+        return None
+    return cached.get("found")
+
+def save_cached_results(mtimes: Dict[str, Optional[int]], found: List[bool]) -> None:
+    """Write the cache atomically; failing to write it is not an error."""
+    path = cache_file()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"checks": CHECKLIST, "mtimes": mtimes, "found": found}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main test function."""
+    parser = argparse.ArgumentParser(description="Verify deployment readiness.")
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="check every entry even if DEPLOY_CHECK_CACHE is set",
+    )
+    args = parser.parse_args(argv)
+    use_cache = USE_CACHE and not args.no_cache
     
-    for dir_path, description in directories:
-        if not check_directory_exists(dir_path, description):
-            all_good = False
+    # The report is collected and written in one go at the end
+    lines = ["🚀 Premium Scraper Deployment Readiness Test", "=" * 50]
     
-    # Check environment files
-    print("\n🔧 Environment Configuration:")
-    env_files = [
-        (".env.example", "Backend environment example"),
-        ("frontend/.env.example", "Frontend environment example"),
-    ]
+    mtimes = parent_mtimes()
+    found = load_cached_results(mtimes) if use_cache else None
+    if found is None:
+        listings = scan_parents(list(mtimes))
+        found = []
+        for _, path, _, want in CHECKS:
+            found.append(check_entry(listings, path, want))
+            if FAST_FAIL and not found[-1]:
+                break
+        else:
+            if use_cache:
+                save_cached_results(mtimes, found)
+    elif FAST_FAIL and not all(found):
+        found = found[:found.index(False) + 1]
+    all_good = all(found)
     
-    for file_path, description in env_files:
-        if not check_file_exists(file_path, description):
-            all_good = False
+    results = zip(CHECKS, found)
+    for section, checks in groupby(results, key=lambda result: result[0][0]):
+        lines.append(f"\n{section}:")
+        lines.extend(
+            (_OK if ok else _BAD)(description, path)
+            for (_, path, description, _), ok in checks
+        )
     
     # Summary
-    print("\n" + "=" * 50)
+    lines.append("\n" + "=" * 50)
     if all_good:
-        print("🎉 All deployment files are ready!")
-        print("\n📋 Next Steps:")
-        print("1. Set up Supabase project and run SQL schema")
-        print("2. Configure environment variables")
-        print("3. Push code to GitHub")
-        print("4. Deploy frontend to Vercel")
-        print("5. Deploy backend to Railway")
-        print("6. Connect frontend to backend")
-        print("\n📚 See DEPLOYMENT_GUIDE.md for detailed instructions")
+        lines.append("🎉 All deployment files are ready!")
+        lines.append("\n📋 Next Steps:")
+        lines.append("1. Set up Supabase project and run SQL schema")
+        lines.append("2. Configure environment variables")
+        lines.append("3. Push code to GitHub")
+        lines.append("4. Deploy frontend to Vercel")
+        lines.append("5. Deploy backend to Railway")
+        lines.append("6. Connect frontend to backend")
+        lines.append("\n📚 See DEPLOYMENT_GUIDE.md for detailed instructions")
     else:
-        print("❌ Some files are missing. Please check the errors above.")
-        print("Make sure you're running this script from the project root directory.")
+        lines.append("❌ Some files are missing. Please check the errors above.")
+        lines.append("Make sure you're running this script from the project root directory.")
     
+    print("\n".join(lines))
     return 0 if all_good else 1
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+"""
+Tests for product quality scoring and duplicate merging.
+"""
+
+import itertools
+from datetime import datetime
+
+from src.processing.normalizer import DataQualityScorer, ProductDeduplicator
+
+FIELDS = {
+    'title': 'Wireless Mouse',
+    'brand': 'Acme',
+    'description': 'A mouse',
+    'category': 'Electronics',
+    'current_price': 19.99,
+    'availability': 'in_stock',
+    'primary_image_url': 'https://example.com/mouse.jpg',
+    'additional_images': ['https://example.com/mouse-2.jpg'],
+    'specifications': {'dpi': '1600'},
+    'features': ['Bluetooth'],
+    'rating': 4.5,
+    'review_count': 120,
+}
+
+
+def _product(**fields):
+    return {'availability': 'unknown', **fields}
+
+
+def test_batch_quality_scores_match_per_product_scores():
+    # Every combination of the first six fields plus some fuller products
+    products = [
+        _product(**{name: FIELDS[name] for name, present in zip(FIELDS, mask) if present})
+        for mask in itertools.product([False, True], repeat=6)
+    ]
+    products += [_product(**FIELDS), _product(), _product(bullet_points=['Compact'], rating=3.0)]
+
+    batch = DataQualityScorer.calculate_quality_scores(products)
+
+    assert batch.tolist() == [DataQualityScorer.calculate_quality_score(product) for product in products]
+    assert DataQualityScorer.calculate_quality_scores([]).shape == (0,)
+
+
+def test_merge_duplicates_batch_keeps_the_highest_quality_product():
+    sparse = _product(id='sparse', title='Wireless Mouse', brand='Acme')
+    full = _product(id='full', **FIELDS)
+    scored = _product(id='scored', title='Wireless Mouse', data_quality_score=0.99)
+
+    merged = ProductDeduplicator().merge_duplicates_batch(
+        [[sparse, full], [sparse, scored]], now=datetime(2024, 1, 1)
+    )
+
+    # Unscored products are ranked by computed quality; stored scores win as is
+    assert [product['id'] for product in merged] == ['full', 'scored']
+    assert [product['duplicate_count'] for product in merged] == [2, 2]
+    assert all(product['merged_at'] == '2024-01-01T00:00:00' for product in merged)
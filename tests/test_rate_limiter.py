@@ -0,0 +1,71 @@
+"""
+Tests for the scraper's request rate limiter.
+"""
+
+import asyncio
+
+import pytest
+
+from src.scraper.base import PremiumBaseScraper, _LeakyBucket
+
+
+class FakeClock:
+    """Event loop time that only moves when a caller sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.now += delay
+
+
+class DummyScraper(PremiumBaseScraper):
+    async def _parse_product_page(self, content, url):
+        return {}
+
+    async def _extract_product_urls(self, content):
+        return []
+
+
+def _request_starts(monkeypatch, bucket, count):
+    """Times at which `count` concurrent requests get through `bucket`."""
+    clock = FakeClock()
+    monkeypatch.setattr(asyncio, 'sleep', clock.sleep)
+    starts = []
+
+    async def request():
+        await bucket.acquire()
+        starts.append(clock.now)
+
+    async def run():
+        monkeypatch.setattr(asyncio.get_running_loop(), 'time', clock.time)
+        await asyncio.gather(*(request() for _ in range(count)))
+
+    asyncio.run(run())
+    return starts
+
+
+def _gaps(starts):
+    return [later - earlier for earlier, later in zip(starts, starts[1:])]
+
+
+def test_requests_are_spaced_at_least_one_interval_apart(monkeypatch):
+    starts = _request_starts(monkeypatch, _LeakyBucket(lambda: 4.0), 6)
+
+    assert starts[0] == 0.0
+    assert all(gap >= 0.25 for gap in _gaps(starts))
+    assert starts[-1] == pytest.approx(5 * 0.25)
+
+
+def test_rate_follows_the_scrapers_current_settings(monkeypatch):
+    scraper = DummyScraper('dummy', 'https://example.com')
+    scraper.request_delay = 2.0
+
+    starts = _request_starts(monkeypatch, scraper.rate_limiter, 4)
+
+    interval = scraper.request_delay / scraper.max_concurrent_requests
+    assert all(gap >= interval for gap in _gaps(starts))
+    assert starts[-1] == pytest.approx(3 * interval)
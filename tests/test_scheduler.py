@@ -0,0 +1,75 @@
+"""
+Tests for the job scheduler.
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+
+from src.models.product import ScrapingJobCreate
+from src.scheduling.scheduler import JobScheduler, SCHEDULE_INTERVALS
+
+
+def test_scheduler_runs_active_jobs_and_skips_cancelled(monkeypatch):
+    """Due jobs go to the job runner every interval; cancelled jobs never do."""
+    interval = timedelta(milliseconds=100)
+    monkeypatch.setitem(SCHEDULE_INTERVALS, 'daily', interval)
+    runs = []
+
+    async def job_runner(job_id, job_data):
+        runs.append((job_id, job_data, time.time()))
+
+    async def run():
+        scheduler = JobScheduler(job_runner=job_runner)
+        active_id = scheduler.schedule_daily_catalog_scrape(
+            retailer='amazon',
+            category_url='https://www.amazon.com/s?k=electronics',
+            job_name='Amazon Electronics Daily'
+        )
+        cancelled_id = scheduler.schedule_daily_catalog_scrape(
+            retailer='walmart',
+            category_url='https://www.walmart.com/browse/home/home-garden',
+            job_name='Walmart Home & Garden Daily'
+        )
+        assert scheduler.cancel_scheduled_job(cancelled_id)
+        assert set(scheduler.get_next_run_times()) == {active_id}
+
+        loop_task = asyncio.create_task(scheduler.start_scheduler())
+        await asyncio.sleep(0.35)
+        scheduler.stop_scheduler()
+        loop_task.cancel()
+        return active_id, cancelled_id
+
+    active_id, cancelled_id = asyncio.run(run())
+
+    run_ids = [job_id for job_id, _, _ in runs]
+    assert cancelled_id not in run_ids
+    assert len(run_ids) >= 2
+    assert set(run_ids) == {active_id}
+
+    job_data = runs[0][1]
+    assert isinstance(job_data, ScrapingJobCreate)
+    assert job_data.name == 'Scheduled: Amazon Electronics Daily'
+    assert job_data.retailer == 'amazon'
+    assert job_data.job_type == 'catalog'
+    assert job_data.configuration['category_url'] == 'https://www.amazon.com/s?k=electronics'
+
+    # Each run is rescheduled one interval later
+    run_times = [run_time for _, _, run_time in runs]
+    for earlier, later in zip(run_times, run_times[1:]):
+        assert later - earlier >= interval.total_seconds() * 0.9
+
+
+def test_scheduling_without_job_runner_is_rejected():
+    """Jobs aren't accepted when nothing could ever run them."""
+    scheduler = JobScheduler()
+
+    with pytest.raises(RuntimeError):
+        scheduler.schedule_weekly_search_scrape(
+            retailer='target',
+            search_queries=['shoes'],
+            job_name='Target Shoes'
+        )
+    assert scheduler.get_scheduled_jobs() == []